@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from .client import connect
+from .client import connect, connect_pool
 
 __all__ = [
     "connect",
+    "connect_pool",
 ]
 
 # TODO(embedded): expose an embedded connect() variant when a Python extension
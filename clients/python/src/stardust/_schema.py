@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import functools
+import os
+
+import capnp
+
+_SCHEMA_DIR = os.path.join(os.path.dirname(__file__), "schemas")
+_GRAPH_CAPNP_PATH = os.path.join(_SCHEMA_DIR, "graph.capnp")
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_capnp_include_paths() -> tuple[str, ...]:
+    paths: list[str] = []
+    env = os.environ.get("CAPNP_INCLUDE_DIR") or os.environ.get("CAPNP_PATH")
+    if env:
+        for p in env.split(os.pathsep):
+            if p:
+                paths.append(p)
+    common_candidates = [
+        "/opt/homebrew/include",
+        "/usr/local/include",
+        "/usr/include",
+    ]
+    for base in common_candidates:
+        if os.path.exists(os.path.join(base, "capnp", "c++.capnp")):
+            paths.append(base)
+    # dict keeps first-seen order while dropping duplicates
+    return tuple(dict.fromkeys(paths))
+
+
+# Compiled once per process; every client module imports this handle.
+graph_capnp = capnp.load(_GRAPH_CAPNP_PATH, imports=list(_discover_capnp_include_paths()))
@@ -1,74 +1,213 @@
 from __future__ import annotations
 
 import asyncio
-import os
+import functools
+import itertools
 import socket
-from collections.abc import Iterable, Mapping
+import struct
+import time
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any, Optional, cast
+from typing import Any, NamedTuple, Optional, cast
+from urllib.parse import urlsplit
 
 import capnp
+import numpy as np
+from numpy.typing import NDArray
 
-_SCHEMA_DIR = os.path.join(os.path.dirname(__file__), "schemas")
-_GRAPH_CAPNP_PATH = os.path.join(_SCHEMA_DIR, "graph.capnp")
-
-
-def _discover_capnp_include_paths() -> list[str]:
-    paths: list[str] = []
-    env = os.environ.get("CAPNP_INCLUDE_DIR") or os.environ.get("CAPNP_PATH")
-    if env:
-        for p in env.split(os.pathsep):
-            if p:
-                paths.append(p)
-    common_candidates = [
-        "/opt/homebrew/include",
-        "/usr/local/include",
-        "/usr/include",
-    ]
-    for base in common_candidates:
-        if os.path.exists(os.path.join(base, "capnp", "c++.capnp")):
-            paths.append(base)
-    seen: set[str] = set()
-    unique_paths: list[str] = []
-    for p in paths:
-        if p not in seen:
-            seen.add(p)
-            unique_paths.append(p)
-    return unique_paths
-
-
-_CAPNP_IMPORT_DIRS = _discover_capnp_include_paths()
-graph_capnp = capnp.load(_GRAPH_CAPNP_PATH, imports=_CAPNP_IMPORT_DIRS)
+from ._schema import graph_capnp
+
+_StructReader = capnp.lib.capnp._DynamicStructReader
+_ListReader = capnp.lib.capnp._DynamicListReader
+_Enum = capnp.lib.capnp._DynamicEnum
+
+# float32 vectors travel as little-endian bytes (VectorF32.data)
+_F32 = np.dtype("<f4")
+_U64 = np.dtype("<u8")
+# raw buffers (bytes/bytearray/memoryview) are taken as packed float32 data
+VectorLike = Sequence[float] | NDArray[np.float32] | bytes | bytearray | memoryview
 
 
 # -------------------- Public API --------------------
 
-def _normalize_address(url: str) -> str:
-    if url.startswith("unix:"):
-        return url
-    if url.startswith("tcp://"):
-        return url[len("tcp://") :]
-    return url
 
+class _Address(NamedTuple):
+    host: str  # socket path for unix addresses
+    port: int | None  # None for unix addresses
 
-async def connect(url: str) -> StardustClient:
+
+@functools.lru_cache(maxsize=256)
+def _parse_address(url: str) -> _Address:
+    if url.startswith("unix:"):
+        return _Address(url[len("unix:") :], None)
+    rest = url[len("tcp://") :] if url.startswith("tcp://") else url
+    # urlsplit copes with bracketed IPv6 literals, which a plain split(":") does not
+    parts = urlsplit("//" + rest)
+    if not parts.hostname or parts.port is None:
+        raise ValueError(f"expected host:port or unix:/path, got {url!r}")
+    return _Address(parts.hostname, parts.port)
+
+
+async def connect(
+    url: str, *, coalesce_writes: bool = True, lazy_reads: bool = False
+) -> StardustClient:
+    """Connect to a Stardust server at tcp://host:port, host:port or unix:/path.
+
+    Reads return plain dicts. With `lazy_reads=True` they return ReaderView /
+    NodeView mappings instead, which convert fields only when accessed; call
+    `to_dict()` on them where a real dict is needed (e.g. json.dumps).
+    """
     if url.startswith("embedded:"):
         raise RuntimeError("Embedded engine not available. Install future embedded extra.")
 
-    addr = _normalize_address(url)
+    addr = _parse_address(url)
 
-    if addr.startswith("unix:"):
-        path = addr[len("unix:") :]
-        connection = await capnp.AsyncIoStream.create_unix_connection(path=path)
+    if addr.port is None:
+        connection = await _open_stream(coalesce_writes, path=addr.host)
     else:
-        host, port_str = addr.split(":", 1)
-        port = int(port_str)
-        connection = await capnp.AsyncIoStream.create_connection(host=host, port=port)
+        connection = await _open_tcp_stream(addr.host, addr.port, coalesce_writes)
 
     tp_client = capnp.TwoPartyClient(connection)
 
     service = tp_client.bootstrap().cast_as(graph_capnp.Stardust)
-    return StardustClient(service, _async_transport=_AsyncTransport(connection, tp_client))
+    return StardustClient(
+        service, _async_transport=_AsyncTransport(connection, tp_client), lazy_reads=lazy_reads
+    )
+
+
+async def connect_pool(
+    url: str, n: int = 4, *, coalesce_writes: bool = True, lazy_reads: bool = False
+) -> StardustClientPool:
+    """Open `n` connections to `url` concurrently and round-robin calls across them."""
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    opened = await asyncio.gather(
+        *(connect(url, coalesce_writes=coalesce_writes, lazy_reads=lazy_reads) for _ in range(n)),
+        return_exceptions=True,
+    )
+    clients = [c for c in opened if isinstance(c, StardustClient)]
+    if len(clients) != n:
+        await asyncio.gather(*(c.aclose() for c in clients))
+        raise next(e for e in opened if isinstance(e, BaseException))
+    return StardustClientPool(clients)
+
+
+_RESOLVE_CACHE_SIZE = 256
+# seconds a lookup is reused; short, so reconnects follow DNS changes (failover etc.)
+_RESOLVE_TTL = 30.0
+_resolved: dict[tuple[str, int], tuple[float, tuple[tuple[int, str], ...]]] = {}
+
+
+async def _resolve(host: str, port: int) -> tuple[tuple[int, str], ...]:
+    # (family, ip) candidates for host:port. Lookups go through the loop's
+    # resolver so a cold miss never blocks, and are reused for _RESOLVE_TTL
+    # seconds by later connects.
+    key = (host, port)
+    now = time.monotonic()
+    hit = _resolved.get(key)
+    if hit is not None and now - hit[0] < _RESOLVE_TTL:
+        return hit[1]
+    infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    addrs = tuple(dict.fromkeys((int(fam), str(sa[0])) for fam, _, _, _, sa in infos))
+    _resolved.pop(key, None)
+    if len(_resolved) >= _RESOLVE_CACHE_SIZE:
+        del _resolved[next(iter(_resolved))]
+    _resolved[key] = (now, addrs)
+    return addrs
+
+
+async def _open_tcp_stream(host: str, port: int, coalesce: bool) -> Any:
+    candidates = await _resolve(host, port)
+    last_exc: OSError | None = None
+    for family, ip in candidates:
+        try:
+            return await _open_stream(coalesce, host=ip, port=port, family=family)
+        except OSError as exc:
+            last_exc = exc
+    # none worked; the records may be stale, so resolve afresh next time
+    _resolved.pop((host, port), None)
+    raise last_exc or OSError(f"no addresses found for {host}:{port}")
+
+
+# Pending bytes at which a coalesced write is flushed without waiting for the tick to end.
+_COALESCE_FLUSH_BYTES = 64 * 1024
+
+
+class _CoalescingTransport:
+    """Write-buffering wrapper around an asyncio transport (a BufWriter for the socket).
+
+    pycapnp hands every segment of every message to ``transport.write`` separately, so a
+    burst of small requests costs one send() per piece. Writes made during one event-loop
+    tick are joined and sent together instead; a flush is forced once the buffer reaches
+    ``_COALESCE_FLUSH_BYTES`` so the real transport's flow control still applies.
+    """
+
+    __slots__ = ("_transport", "_pending", "_pending_bytes", "_scheduled")
+
+    def __init__(self, transport: asyncio.Transport) -> None:
+        self._transport = transport
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._scheduled = False
+
+    def write(self, data: bytes) -> None:
+        self._pending.append(data)
+        self._pending_bytes += len(data)
+        if self._pending_bytes >= _COALESCE_FLUSH_BYTES:
+            self._flush()
+        elif not self._scheduled:
+            self._scheduled = True
+            asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        self._scheduled = False
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+        self._pending_bytes = 0
+        if self._transport.is_closing():
+            return
+        self._transport.write(pending[0] if len(pending) == 1 else b"".join(pending))
+
+    def write_eof(self) -> None:
+        self._flush()
+        self._transport.write_eof()
+
+    def close(self) -> None:
+        self._flush()
+        self._transport.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._transport, name)
+
+
+async def _open_stream(coalesce: bool, **kwargs: Any) -> Any:
+    # `path=` opens a unix socket, otherwise kwargs go to loop.create_connection
+    unix = "path" in kwargs
+    if not coalesce:
+        if unix:
+            return await capnp.AsyncIoStream.create_unix_connection(**kwargs)
+        return await capnp.AsyncIoStream.create_connection(**kwargs)
+
+    # Same as AsyncIoStream.create_(unix_)connection, but keeps hold of the protocol so
+    # its transport can be wrapped. _connect is the factory pycapnp's own servers use.
+    loop = asyncio.get_running_loop()
+    opened: asyncio.Future[Any] = loop.create_future()
+
+    def factory() -> Any:
+        return capnp.AsyncIoStream._connect(opened.set_result)
+
+    if unix:
+        _, protocol = await loop.create_unix_connection(factory, **kwargs)
+    else:
+        _, protocol = await loop.create_connection(factory, **kwargs)
+        sock = protocol.transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    protocol.transport = _CoalescingTransport(protocol.transport)
+    return await opened
 
 
 class _AsyncTransport:
@@ -77,7 +216,102 @@ class _AsyncTransport:
         self.capnp_client = capnp_client
 
 
-@dataclass
+# -------------------- Read results --------------------
+
+
+class ReaderView(Mapping[str, Any]):
+    """Read-only mapping over a Cap'n Proto struct reader.
+
+    Keys and nesting match ``reader.to_dict()``, but fields are only converted
+    to Python objects when accessed. Use ``to_dict()`` for a plain dict.
+    """
+
+    __slots__ = ("_reader", "_keys")
+
+    def __init__(self, reader: Any) -> None:
+        self._reader = reader
+        self._keys: tuple[str, ...] | None = None
+
+    def _fields(self) -> tuple[str, ...]:
+        if self._keys is None:
+            r = self._reader
+            schema = r.schema
+            keys = [r.which()] if schema.union_fields else []
+            # unset pointer fields are left out, as in to_dict()
+            keys.extend(f for f in schema.non_union_fields if r._has(f))
+            self._keys = tuple(keys)
+        return self._keys
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields():
+            raise KeyError(key)
+        return _wrap_reader(self._reader._get(key))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields())
+
+    def __len__(self) -> int:
+        return len(self._fields())
+
+    def to_dict(self) -> dict[str, Any]:
+        return cast(dict[str, Any], self._reader.to_dict())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class ListView(Sequence[Any]):
+    """Read-only sequence over a Cap'n Proto list reader; elements convert on access."""
+
+    __slots__ = ("_reader",)
+
+    def __init__(self, reader: Any) -> None:
+        self._reader = reader
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [_wrap_reader(self._reader[i]) for i in range(len(self._reader))[index]]
+        return _wrap_reader(self._reader[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(_wrap_reader, self._reader)
+
+    def __len__(self) -> int:
+        return len(self._reader)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ListView | list | tuple):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def to_list(self) -> list[Any]:
+        return [_plain(v) for v in self]
+
+    def __repr__(self) -> str:
+        return f"ListView({self.to_list()!r})"
+
+
+class NodeView(ReaderView):
+    """get_node result, with typed accessors for the node header."""
+
+    __slots__ = ()
+
+    @property
+    def id(self) -> int:
+        return int(self._reader.header.id)
+
+    @property
+    def labels(self) -> list[str]:
+        return list(self._reader.header.labels.names)
+
+    @property
+    def hot_props(self) -> dict[str, Any]:
+        return {p.key: _value_from_reader(p.val) for p in self._reader.header.hotProps}
+
+
+@dataclass(slots=True, frozen=True)
 class KnnHit:
     id: int
     score: float
@@ -89,9 +323,31 @@ class StardustClient:
     This class provides snake_case methods and Python-native types.
     """
 
-    def __init__(self, svc: Any, _async_transport: Optional[_AsyncTransport] = None) -> None:
+    def __init__(
+        self,
+        svc: Any,
+        _async_transport: Optional[_AsyncTransport] = None,
+        *,
+        lazy_reads: bool = False,
+    ) -> None:
         self._svc = svc
         self._async_transport = _async_transport
+        self._lazy_reads = lazy_reads
+        # resolve request factories once; pycapnp looks these up dynamically
+        self._create_node_req = svc.createNode_request
+        self._upsert_vector_req = svc.upsertVector_request
+        self._upsert_vector_stream_req = svc.upsertVectorStream_request
+        self._delete_vector_req = svc.deleteVector_request
+        self._add_edge_req = svc.addEdge_request
+        self._get_node_req = svc.getNode_request
+        self._get_node_props_req = svc.getNodeProps_request
+        self._get_vectors_req = svc.getVectors_request
+        self._get_edge_req = svc.getEdge_request
+        self._get_nodes_batch_req = svc.getNodesBatch_request
+        self._get_edges_batch_req = svc.getEdgesBatch_request
+        self._list_adjacency_req = svc.listAdjacency_request
+        self._degree_req = svc.degree_request
+        self._knn_req = svc.knn_request
 
     # -------------------- Lifecycle --------------------
 
@@ -117,59 +373,21 @@ class StardustClient:
         labels: Iterable[str] | None = None,
         hot_props: Mapping[str, Any] | None = None,
         cold_props: Mapping[str, Any] | None = None,
-        vectors: Iterable[tuple[str, list[float]]] | None = None,
+        vectors: Iterable[tuple[str, VectorLike]] | None = None,
     ) -> dict[str, Any]:
         """Create a node.
 
         Returns a dict with keys: {"node": {"id": int}, "header": {...}}.
         """
-        req = self._svc.createNode_request()
-        params = req.init("params")
-        ls = params.init("labels")
-
-        _names = list(labels or [])
-        arr = ls.init("names", len(_names))
-        for i, nm in enumerate(_names):
-            arr[i] = nm
-
-        _hot = list((hot_props or {}).items())
-        hp = params.init("hotProps", len(_hot))
-        for i, (k, v) in enumerate(_hot):
-            item = hp[i]
-            item.key = k
-
-            _set_value(item.init("val"), v)
-        _cold = list((cold_props or {}).items())
-        cp = params.init("coldProps", len(_cold))
-        for i, (k, v) in enumerate(_cold):
-            item = cp[i]
-            item.key = k
-            _set_value(item.init("val"), v)
-
-        _vecs = list(vectors or [])
-        vp = params.init("vectors", len(_vecs))
-        for i, (tag, vec) in enumerate(_vecs):
-            item = vp[i]
-            item.tag = tag
-            vf = item.init("vector")
-            vf.dim = len(vec)
-            vf.data = _floats_to_bytes(vec)
-
+        req = self._build_create_node(labels, hot_props, cold_props, vectors)
         res = await req.send()
-        return cast(dict[str, Any], res.to_dict()['result'])
+        return cast(dict[str, Any], res.result.to_dict())
 
-    async def upsert_vector(self, node_id: int, tag: str, vector: list[float]) -> None:
-        req = self._svc.upsertVector_request()
-        params = req.init("params")
-        params.id = node_id
-        params.tag = tag
-        vf = params.init("vector")
-        vf.dim = len(vector)
-        vf.data = _floats_to_bytes(vector)
-        await req.send()
+    async def upsert_vector(self, node_id: int, tag: str, vector: VectorLike) -> None:
+        await self._build_upsert_vector(node_id, tag, vector).send()
 
     async def delete_vector(self, node_id: int, tag: str) -> None:
-        req = self._svc.deleteVector_request()
+        req = self._delete_vector_req()
         params = req.init("params")
         params.id = node_id
         params.tag = tag
@@ -178,109 +396,377 @@ class StardustClient:
     async def add_edge(
         self, src: int, dst: int, edge_type: str, props: Mapping[str, Any] | None = None
     ) -> dict[str, Any]:
-        req = self._svc.addEdge_request()
+        res = await self._build_add_edge(src, dst, edge_type, props).send()
+        return cast(dict[str, Any], res.edge.to_dict())
+
+    # -------------------- Bulk writes --------------------
+    # All requests are sent before any is awaited, so Cap'n Proto pipelines
+    # them over the one connection and the batch costs a single round trip.
+
+    async def create_nodes_bulk(self, nodes: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        """Create many nodes; each item holds create_node keyword arguments.
+
+        Results are returned in input order.
+        """
+        promises = [self._build_create_node(**spec).send() for spec in nodes]
+        results = await asyncio.gather(*promises)
+        return [cast(dict[str, Any], res.result.to_dict()) for res in results]
+
+    async def upsert_vectors_bulk(self, items: Iterable[tuple[int, str, VectorLike]]) -> None:
+        """Upsert many (node_id, tag, vector) triples."""
+        promises = [
+            self._build_upsert_vector(node_id, tag, vector).send() for node_id, tag, vector in items
+        ]
+        await asyncio.gather(*promises)
+
+    async def add_edges_bulk(
+        self, edges: Iterable[tuple[int, int, str, Mapping[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Add many (src, dst, edge_type, props) edges.
+
+        Results are returned in input order.
+        """
+        promises = [
+            self._build_add_edge(src, dst, edge_type, props).send()
+            for src, dst, edge_type, props in edges
+        ]
+        results = await asyncio.gather(*promises)
+        return [cast(dict[str, Any], res.edge.to_dict()) for res in results]
+
+    async def stream_upsert_vectors(
+        self,
+        items: Iterable[tuple[int, str, VectorLike]] | AsyncIterable[tuple[int, str, VectorLike]],
+        *,
+        window: int = 64,
+    ) -> int:
+        """Upsert (node_id, tag, vector) triples over the upsertVectorStream RPC.
+
+        At most `window` calls are in flight: once the window is full the oldest
+        call is awaited before the next is sent, so memory stays flat however
+        long `items` is. Accepts sync or async iterables; returns the count sent.
+        """
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        inflight: deque[Any] = deque()
+        sent = 0
+        async for node_id, tag, vector in _as_async_iter(items):
+            if len(inflight) >= window:
+                await inflight.popleft()
+            inflight.append(self._build_upsert_vector(node_id, tag, vector, stream=True).send())
+            sent += 1
+        while inflight:
+            await inflight.popleft()
+        return sent
+
+    # -------------------- Request builders --------------------
+
+    def _build_create_node(
+        self,
+        labels: Iterable[str] | None = None,
+        hot_props: Mapping[str, Any] | None = None,
+        cold_props: Mapping[str, Any] | None = None,
+        vectors: Iterable[tuple[str, VectorLike]] | None = None,
+    ) -> Any:
+        _labels = _as_seq(labels)
+        _vecs = _as_seq(vectors)
+        req = self._create_node_req()
+        params = req.init("params")
+        ls = params.init("labels")
+
+        # Text lists take a whole list/tuple in one call
+        ls.names = _labels
+
+        _encode_props(params, "hotProps", hot_props)
+        _encode_props(params, "coldProps", cold_props)
+
+        vp = params.init("vectors", len(_vecs))
+        for item, (tag, vec) in zip(vp, _vecs, strict=True):
+            item.tag = tag
+            _set_vector(item.init("vector"), vec)
+        return req
+
+    def _build_upsert_vector(
+        self, node_id: int, tag: str, vector: VectorLike, *, stream: bool = False
+    ) -> Any:
+        req = self._upsert_vector_stream_req() if stream else self._upsert_vector_req()
+        params = req.init("params")
+        params.id = node_id
+        params.tag = tag
+        _set_vector(params.init("vector"), vector)
+        return req
+
+    def _build_add_edge(
+        self, src: int, dst: int, edge_type: str, props: Mapping[str, Any] | None = None
+    ) -> Any:
+        req = self._add_edge_req()
         params = req.init("params")
         params.src = src
         params.dst = dst
         meta = params.init("meta")
         meta.type = edge_type
-        _props = list((props or {}).items())
-        arr = meta.init("props", len(_props))
-        for i, (k, v) in enumerate(_props):
-            item = arr[i]
-            item.key = k
-            _set_value(item.init("val"), v)
-        res = await req.send()
-        return cast(dict[str, Any], res.to_dict()['edge'])
+        _encode_props(meta, "props", props)
+        return req
 
     # -------------------- Reads --------------------
 
-    async def get_node(self, node_id: int) -> dict[str, Any]:
-        req = self._svc.getNode_request()
+    # Each read returns a plain dict, or with lazy_reads a view over the reply.
+
+    def _read_result(self, reader: Any, view: type[ReaderView] = ReaderView) -> Any:
+        return view(reader) if self._lazy_reads else cast(dict[str, Any], reader.to_dict())
+
+    async def get_node(self, node_id: int) -> Mapping[str, Any]:
+        req = self._get_node_req()
         params = req.init("params")
         params.id = node_id
         res = await req.send()
-        return cast(dict[str, Any], res.to_dict()['result'])
+        return cast(Mapping[str, Any], self._read_result(res.result, NodeView))
 
-    async def get_node_props(self, node_id: int, keys: Iterable[str] | None = None) -> dict[str, Any]:
-        req = self._svc.getNodeProps_request()
+    async def get_node_props(
+        self, node_id: int, keys: Iterable[str] | None = None
+    ) -> Mapping[str, Any]:
+        req = self._get_node_props_req()
         params = req.init("params")
         params.id = node_id
-        _keys = list(keys or [])
-        arr = params.init("keys", len(_keys))
-        for i, k in enumerate(_keys):
-            arr[i] = k
+        params.keys = _as_seq(keys)
         res = await req.send()
-        return cast(dict[str, Any], res.to_dict()['result'])
+        return cast(Mapping[str, Any], self._read_result(res.result))
 
-    async def get_vectors(self, node_id: int, tags: Iterable[str] | None = None) -> dict[str, Any]:
-        req = self._svc.getVectors_request()
+    async def get_vectors(
+        self, node_id: int, tags: Iterable[str] | None = None
+    ) -> Mapping[str, Any]:
+        req = self._get_vectors_req()
         params = req.init("params")
         params.id = node_id
-        _tags = list(tags or [])
-        arr = params.init("tags", len(_tags))
-        for i, t in enumerate(_tags):
-            arr[i] = t
+        params.tags = _as_seq(tags)
         res = await req.send()
-        return cast(dict[str, Any], res.to_dict()['result'])
+        return cast(Mapping[str, Any], self._read_result(res.result))
 
-    async def get_edge(self, edge_id: int) -> dict[str, Any]:
-        req = self._svc.getEdge_request()
+    async def get_edge(self, edge_id: int) -> Mapping[str, Any]:
+        req = self._get_edge_req()
         params = req.init("params")
         params.edgeId = edge_id
         res = await req.send()
         # merged response: { edge: {id,src,dst}, meta: {type, props:[...] } }
-        return cast(dict[str, Any], res.to_dict())
+        return cast(Mapping[str, Any], self._read_result(res))
+
+    async def get_nodes(self, node_ids: Iterable[int]) -> list[Mapping[str, Any]]:
+        """Fetch many node headers in one RPC, in the order of `node_ids`."""
+        req = self._get_nodes_batch_req()
+        req.init("params").ids = _as_seq(node_ids)
+        res = await req.send()
+        return [self._read_result(h) for h in res.result.headers]
+
+    async def get_edges(self, edge_ids: Iterable[int]) -> list[Mapping[str, Any]]:
+        """Fetch many edges in one RPC, in the order of `edge_ids`.
+
+        Each item has the same {edge, meta} shape as get_edge.
+        """
+        req = self._get_edges_batch_req()
+        req.init("params").edgeIds = _as_seq(edge_ids)
+        res = await req.send()
+        return [self._read_result(e) for e in res.result.edges]
 
-    async def list_adjacency(self, node: int, direction: str = "both", limit: int = 100) -> dict[str, Any]:
-        req = self._svc.listAdjacency_request()
+    async def list_adjacency(
+        self, node: int, direction: str = "both", limit: int = 100
+    ) -> Mapping[str, Any]:
+        req = self._list_adjacency_req()
         params = req.init("params")
         params.node = node
         params.limit = limit
         params.direction = _direction_from_str(direction)
         res = await req.send()
-        return cast(dict[str, Any], res.to_dict()['result'])
+        return cast(Mapping[str, Any], self._read_result(res.result))
 
-    async def degree(self, node: int, direction: str = "both") -> dict[str, Any]:
-        req = self._svc.degree_request()
+    async def degree(self, node: int, direction: str = "both") -> Mapping[str, Any]:
+        req = self._degree_req()
         params = req.init("params")
         params.node = node
         params.direction = _direction_from_str(direction)
         res = await req.send()
-        return cast(dict[str, Any], res.to_dict()['result'])
+        return cast(Mapping[str, Any], self._read_result(res.result))
 
-    async def knn(self, tag: str, query: list[float], k: int) -> list[KnnHit]:
-        req = self._svc.knn_request()
-        params = req.init("params")
-        params.tag = tag
-        vf = params.init("query")
-        vf.dim = len(query)
-        vf.data = _floats_to_bytes(query)
-        params.k = k
-        res = await req.send()
+    async def knn(self, tag: str, query: VectorLike, k: int) -> list[KnnHit]:
+        res = await self._build_knn(tag, query, k).send()
         out: list[KnnHit] = []
         for h in res.result.hits:
             out.append(KnnHit(id=int(h.id), score=float(h.score)))
         return out
 
+    async def knn_arrays(
+        self, tag: str, query: VectorLike, k: int
+    ) -> tuple[NDArray[np.uint64], NDArray[np.float32]]:
+        """Like knn, but returns (ids, scores) as numpy arrays with no per-hit objects.
+
+        Asks the server for packed little-endian id/score columns. On
+        little-endian hosts the arrays are read-only views over the reply
+        bytes, with no copy beyond pycapnp's; servers that predate
+        KnnParams.packed still send hits.
+        """
+        res = await self._build_knn(tag, query, k, packed=True).send()
+        result = res.result
+        if result._has("ids"):
+            return (
+                np.frombuffer(result.ids, dtype=_U64).astype(np.uint64, copy=False),
+                np.frombuffer(result.scores, dtype=_F32).astype(np.float32, copy=False),
+            )
+        hits = result.hits
+        n = len(hits)
+        ids = np.empty(n, dtype=np.uint64)
+        scores = np.empty(n, dtype=np.float32)
+        for i, h in enumerate(hits):
+            ids[i] = h.id
+            scores[i] = h.score
+        return ids, scores
+
+    def _build_knn(self, tag: str, query: VectorLike, k: int, packed: bool = False) -> Any:
+        req = self._knn_req()
+        params = req.init("params")
+        params.tag = tag
+        _set_vector(params.init("query"), query)
+        params.k = k
+        params.packed = packed
+        return req
+
+
+class StardustClientPool:
+    """Several StardustClient connections to one server, used round-robin.
+
+    A single connection pipelines requests but is served in order on one
+    server connection; spreading calls over a few lets the server work on
+    them in parallel. Every public StardustClient method is available on the
+    pool, and each call goes to the next connection in turn.
+    """
+
+    def __init__(self, clients: Sequence[StardustClient]) -> None:
+        if not clients:
+            raise ValueError("pool needs at least one client")
+        self._clients = tuple(clients)
+        self._next = itertools.cycle(self._clients).__next__
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def client(self) -> StardustClient:
+        """Return the next connection, e.g. to keep a dependent sequence of calls on one."""
+        return self._next()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._next(), name)
+
+    async def aclose(self) -> None:
+        await asyncio.gather(*(c.aclose() for c in self._clients))
+
 
 # -------------------- Helpers --------------------
 
 
+def _wrap_reader(value: Any) -> Any:
+    if isinstance(value, _StructReader):
+        return ReaderView(value)
+    if isinstance(value, _ListReader):
+        return ListView(value)
+    if isinstance(value, _Enum):
+        return value._as_str()
+    return value
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, ReaderView):
+        return value.to_dict()
+    if isinstance(value, ListView):
+        return value.to_list()
+    return value
+
+
+def _value_from_reader(val: Any) -> Any:
+    # Value union -> Python scalar (nullv reads back as None)
+    return val._get(val.which())
+
+
+_DIRECTIONS: dict[str, Any] = {
+    "out": graph_capnp.Direction.out,
+    "in": getattr(graph_capnp.Direction, "in"),
+    "both": graph_capnp.Direction.both,
+}
+
+
 def _direction_from_str(s: str) -> Any:
-    text = s.lower()
-    if text == "out":
-        return graph_capnp.Direction.out
-    if text == "in":
-        return getattr(graph_capnp.Direction, "in")
-    return graph_capnp.Direction.both
+    return _DIRECTIONS.get(s.lower(), graph_capnp.Direction.both)
+
+
+def _as_seq(items: Iterable[Any] | None) -> Sequence[Any]:
+    # Lists and tuples pass through as-is (pycapnp takes either for a whole
+    # List field); other iterables are materialised once.
+    if items is None:
+        return ()
+    if isinstance(items, list | tuple):
+        return items
+    return list(items)
+
+
+async def _as_async_iter(items: Iterable[Any] | AsyncIterable[Any]) -> AsyncIterator[Any]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+def _set_null(builder: Any, value: Any) -> None:
+    builder.nullv = None
+
+
+def _set_bool(builder: Any, value: bool) -> None:
+    builder.boolv = value
+
+
+def _set_int(builder: Any, value: int) -> None:
+    builder.i64 = value
+
+
+def _set_float(builder: Any, value: float) -> None:
+    builder.f64 = value
+
+
+def _set_text(builder: Any, value: str) -> None:
+    builder.text = value
+
+
+def _set_bytes(builder: Any, value: bytes) -> None:
+    builder.bytes = value
+
+
+def _set_bytearray(builder: Any, value: bytearray) -> None:
+    builder.bytes = bytes(value)
+
+
+# Exact-type dispatch for the Value union. bool gets its own entry, so the
+# bool-before-int ordering the isinstance chain needs does not apply here.
+_VALUE_SETTERS: dict[type, Any] = {
+    type(None): _set_null,
+    bool: _set_bool,
+    int: _set_int,
+    float: _set_float,
+    str: _set_text,
+    bytes: _set_bytes,
+    bytearray: _set_bytearray,
+}
 
 
 def _set_value(builder: Any, value: Any) -> None:
-    # Map Python types into Value union
-    if value is None:
-        builder.nullv = None
-        return
+    setter = _VALUE_SETTERS.get(type(value))
+    if setter is not None:
+        setter(builder, value)
+    else:
+        _set_value_slow(builder, value)
+
+
+def _set_value_slow(builder: Any, value: Any) -> None:
+    # Subclasses (IntEnum, np.float64, StrEnum, ...)
+    # and unknown types; map Python types into Value union
     if isinstance(value, bool):
         builder.boolv = bool(value)
         return
@@ -294,15 +780,66 @@ def _set_value(builder: Any, value: Any) -> None:
         builder.bytes = bytes(value)
         return
     if isinstance(value, str):
-        builder.text = value
+        builder.text = str(value)
         return
     # Fallback: try repr as bytes
     builder.bytes = repr(value).encode("utf-8")
 
 
-def _floats_to_bytes(values: Iterable[float]) -> bytes:
-    # pack as float32 array
-    import array
+def _encode_props(builder: Any, field: str, props: Mapping[str, Any] | None) -> None:
+    # Fills List(Property) `field` on `builder`; the _set_value dispatch is
+    # inlined so each property costs one dict probe and two builder calls.
+    _props = props or {}
+    items = builder.init(field, len(_props))
+    setters = _VALUE_SETTERS
+    slow = _set_value_slow
+    for item, (k, v) in zip(items, _props.items(), strict=True):
+        item.key = k
+        setter = setters.get(type(v))
+        if setter is not None:
+            setter(item.init("val"), v)
+        else:
+            slow(item.init("val"), v)
+
+
+def _set_vector(builder: Any, vector: VectorLike) -> None:
+    # Buffers that are already packed float32 are handed to the Data field
+    # as-is; dim is derived from the byte length, so it must be len // 4.
+    if isinstance(vector, bytes | bytearray | memoryview):
+        view = memoryview(vector)
+        # raw bytes, or a typed buffer (e.g. from an ndarray) holding float32
+        if view.format.lstrip("@=<") not in ("B", "b", "c", "f") or view.nbytes % 4:
+            raise ValueError(
+                f"vector buffer must be packed float32, got format {view.format!r}"
+                f" and {view.nbytes} bytes"
+            )
+        builder.dim = view.nbytes // 4
+        builder.data = vector if isinstance(vector, bytes) else view
+        return
+    if isinstance(vector, np.ndarray) and vector.dtype == _F32 and vector.flags.c_contiguous:
+        builder.dim = vector.size
+        builder.data = memoryview(vector)
+        return
+    builder.dim = len(vector)
+    builder.data = _floats_to_bytes(vector)
 
-    ar = array.array("f", (float(v) for v in values))
-    return ar.tobytes()
+
+@functools.lru_cache(maxsize=32)
+def _f32_packer(dim: int) -> struct.Struct:
+    # one compiled packer per embedding width; deployments use only a few
+    return struct.Struct(f"<{dim}f")
+
+
+def _floats_to_bytes(values: Iterable[float] | NDArray[Any]) -> bytes:
+    # pack as float32 array; numpy does the cast in one C loop
+    if isinstance(values, np.ndarray):
+        return values.astype(_F32, copy=False).tobytes()
+    if isinstance(values, list | tuple):
+        # struct packs a list of Python floats ~2.5x faster than np.asarray
+        try:
+            return _f32_packer(len(values)).pack(*values)
+        except (struct.error, OverflowError):
+            pass  # out-of-float32-range values: let numpy saturate to inf as before
+    if isinstance(values, Sequence):
+        return np.asarray(values, dtype=_F32).tobytes()
+    return np.fromiter(values, dtype=_F32).tobytes()
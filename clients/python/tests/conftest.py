@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from mock_stardust import MockStardust, run, serve
+
+from stardust import connect
+from stardust.client import StardustClient
+
+Body = Callable[[StardustClient], Awaitable[Any]]
+
+
+@pytest.fixture
+def db() -> MockStardust:
+    return MockStardust()
+
+
+@pytest.fixture
+def with_client(db: MockStardust) -> Callable[..., Any]:
+    """Run `body(client)` against `db` over a real connection; returns its result."""
+
+    def go(body: Body, **connect_kwargs: Any) -> Any:
+        async def main() -> Any:
+            async with serve(db) as url:
+                client = await connect(url, **connect_kwargs)
+                try:
+                    return await body(client)
+                finally:
+                    await client.aclose()
+
+        return run(main())
+
+    return go
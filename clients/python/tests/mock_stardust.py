@@ -0,0 +1,235 @@
+"""In-memory Stardust server over the real Cap'n Proto schema, for tests.
+
+Implements the RPCs the Python client sends, backed by plain dicts, and
+counts calls per method so tests can check batching and caching. Tests
+mutate `nodes` / `edges` directly to stand in for writes made elsewhere.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from collections import Counter
+from collections.abc import AsyncGenerator, Coroutine
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import capnp
+import numpy as np
+
+from stardust._schema import graph_capnp
+
+# a stored property: (key, {union field: value}) as Value.to_dict() gives it
+Prop = tuple[str, dict[str, Any]]
+
+
+@dataclass
+class Node:
+    labels: list[str]
+    hot: list[Prop] = field(default_factory=list)
+    cold: list[Prop] = field(default_factory=list)
+
+
+@dataclass
+class Edge:
+    src: int
+    dst: int
+    type: str
+    props: list[Prop] = field(default_factory=list)
+
+
+def _read_props(props: Any) -> list[Prop]:
+    return [(p.key, p.val.to_dict()) for p in props]
+
+
+def _write_props(builder: Any, field_name: str, props: list[Prop]) -> None:
+    items = builder.init(field_name, len(props))
+    for item, (key, val) in zip(items, props, strict=True):
+        item.key = key
+        ((which, v),) = val.items()
+        setattr(item.init("val"), which, v)
+
+
+class MockStardust(graph_capnp.Stardust.Server):  # type: ignore[misc,name-defined]
+    def __init__(self) -> None:
+        self.nodes: dict[int, Node] = {}
+        self.edges: dict[int, Edge] = {}
+        # (node id, tag) -> little-endian float32 bytes
+        self.vectors: dict[tuple[int, str], bytes] = {}
+        self.calls: Counter[str] = Counter()
+        # False mimics a server that predates KnnParams.packed
+        self.packed_knn = True
+        self._next_id = 1
+
+    def _new_id(self) -> int:
+        nid = self._next_id
+        self._next_id += 1
+        return nid
+
+    def add_node(
+        self,
+        labels: list[str] | None = None,
+        props: dict[str, dict[str, Any]] | None = None,
+        vectors: dict[str, list[float]] | None = None,
+    ) -> int:
+        """Store a node directly, as a write from another client would."""
+        nid = self._new_id()
+        self.nodes[nid] = Node(list(labels or []), list((props or {}).items()))
+        for tag, vec in (vectors or {}).items():
+            self.vectors[(nid, tag)] = np.asarray(vec, dtype="<f4").tobytes()
+        return nid
+
+    def add_edge(
+        self, src: int, dst: int, type_: str = "REL", props: dict[str, dict[str, Any]] | None = None
+    ) -> int:
+        eid = self._new_id()
+        self.edges[eid] = Edge(src, dst, type_, list((props or {}).items()))
+        return eid
+
+    def _write_header(self, h: Any, nid: int) -> None:
+        node = self.nodes[nid]
+        h.id = nid
+        h.init("labels").names = node.labels
+        _write_props(h, "hotProps", node.hot)
+
+    def _write_edge(self, e: Any, m: Any, eid: int) -> None:
+        edge = self.edges[eid]
+        e.id, e.src, e.dst = eid, edge.src, edge.dst
+        m.type = edge.type
+        _write_props(m, "props", edge.props)
+
+    # -------------------- writes --------------------
+
+    async def createNode(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["createNode"] += 1
+        nid = self._new_id()
+        self.nodes[nid] = Node(
+            list(params.labels.names), _read_props(params.hotProps), _read_props(params.coldProps)
+        )
+        for tv in params.vectors:
+            self.vectors[(nid, tv.tag)] = bytes(tv.vector.data)
+        r = _context.results.init("result")
+        r.init("node").id = nid
+        self._write_header(r.init("header"), nid)
+
+    async def upsertVector(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["upsertVector"] += 1
+        self.vectors[(params.id, params.tag)] = bytes(params.vector.data)
+
+    async def upsertVectorStream(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["upsertVectorStream"] += 1
+        self.vectors[(params.id, params.tag)] = bytes(params.vector.data)
+
+    async def deleteVector(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["deleteVector"] += 1
+        self.vectors.pop((params.id, params.tag), None)
+
+    async def addEdge(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["addEdge"] += 1
+        eid = self._new_id()
+        self.edges[eid] = Edge(
+            params.src, params.dst, params.meta.type, _read_props(params.meta.props)
+        )
+        e = _context.results.init("edge")
+        e.id, e.src, e.dst = eid, params.src, params.dst
+
+    # -------------------- reads --------------------
+
+    async def getNode(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["getNode"] += 1
+        self._write_header(_context.results.init("result").init("header"), params.id)
+
+    async def getNodeProps(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["getNodeProps"] += 1
+        node = self.nodes[params.id]
+        keys = set(params.keys)
+        props = [p for p in node.hot + node.cold if not keys or p[0] in keys]
+        _write_props(_context.results.init("result"), "props", props)
+
+    async def getVectors(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["getVectors"] += 1
+        tags = set(params.tags)
+        found = [
+            (tag, data)
+            for (nid, tag), data in self.vectors.items()
+            if nid == params.id and (not tags or tag in tags)
+        ]
+        out = _context.results.init("result").init("vectors", len(found))
+        for item, (tag, data) in zip(out, found, strict=True):
+            item.tag = tag
+            v = item.init("vector")
+            v.dim = len(data) // 4
+            v.data = data
+
+    async def getEdge(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["getEdge"] += 1
+        r = _context.results
+        self._write_edge(r.init("edge"), r.init("meta"), params.edgeId)
+
+    async def getNodesBatch(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["getNodesBatch"] += 1
+        ids = list(params.ids)
+        headers = _context.results.init("result").init("headers", len(ids))
+        for h, nid in zip(headers, ids, strict=True):
+            self._write_header(h, nid)
+
+    async def getEdgesBatch(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["getEdgesBatch"] += 1
+        eids = list(params.edgeIds)
+        out = _context.results.init("result").init("edges", len(eids))
+        for item, eid in zip(out, eids, strict=True):
+            self._write_edge(item.init("edge"), item.init("meta"), eid)
+
+    async def listAdjacency(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        self.calls["listAdjacency"] += 1
+        rows = []
+        for eid, e in self.edges.items():
+            if params.direction != "in" and e.src == params.node:
+                rows.append((e.dst, eid, e.type, "out"))
+            elif params.direction != "out" and e.dst == params.node:
+                rows.append((e.src, eid, e.type, "in"))
+        rows = rows[: params.limit or None]
+        items = _context.results.init("result").init("items", len(rows))
+        for item, (other, eid, type_, direction) in zip(items, rows, strict=True):
+            item.neighbor, item.edgeId, item.type, item.direction = other, eid, type_, direction
+
+    async def knn(self, params: Any, _context: Any, **kwargs: Any) -> None:
+        # exact dot-product search over the tag's vectors, best first
+        self.calls["knn"] += 1
+        query = np.frombuffer(params.query.data, dtype="<f4")
+        scored = sorted(
+            (
+                (-float(np.dot(np.frombuffer(data, dtype="<f4"), query)), nid)
+                for (nid, tag), data in self.vectors.items()
+                if tag == params.tag
+            ),
+        )[: params.k]
+        r = _context.results.init("result")
+        if params.packed and self.packed_knn:
+            r.ids = np.array([nid for _, nid in scored], dtype="<u8").tobytes()
+            r.scores = np.array([-s for s, _ in scored], dtype="<f4").tobytes()
+            return
+        hits = r.init("hits", len(scored))
+        for hit, (score, nid) in zip(hits, scored, strict=True):
+            hit.id, hit.score = nid, -score
+
+
+@asynccontextmanager
+async def serve(db: MockStardust) -> AsyncGenerator[str]:
+    """Serve `db` on a fresh unix socket; yields the url to connect() to."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "stardust.sock")
+
+        async def on_connection(stream: Any) -> None:
+            await capnp.TwoPartyServer(stream, bootstrap=db).on_disconnect()
+
+        server = await capnp.AsyncIoStream.create_unix_server(on_connection, path)
+        async with server:
+            yield "unix:" + path
+
+
+def run[T](coro: Coroutine[Any, Any, T]) -> T:
+    """Run `coro` to completion inside the Cap'n Proto event loop."""
+    return asyncio.run(capnp.run(coro))
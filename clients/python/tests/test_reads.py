@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import numpy as np
+import pytest
+from mock_stardust import MockStardust, run, serve
+
+from stardust import connect_pool
+from stardust.client import ListView, NodeView, ReaderView, StardustClient
+
+
+async def _triangle(c: StardustClient) -> tuple[list[int], list[int]]:
+    """Nodes 1-3 with text vectors and edges 1->2, 2->3, 3->1."""
+    nodes = await c.create_nodes_bulk([
+        {"labels": ["N"], "hot_props": {"i": i}, "vectors": [("text", [1.0, float(i)])]}
+        for i in range(3)
+    ])
+    ids = [n["node"]["id"] for n in nodes]
+    edges = await c.add_edges_bulk([(ids[i], ids[(i + 1) % 3], "NEXT", None) for i in range(3)])
+    return ids, [e["id"] for e in edges]
+
+
+def test_reads_return_plain_dicts_by_default(with_client: Any) -> None:
+    async def body(c: StardustClient) -> None:
+        ids, eids = await _triangle(c)
+        node = await c.get_node(ids[0])
+        assert type(node) is dict
+        assert node["header"]["labels"]["names"] == ["N"]
+        edge = await c.get_edge(eids[0])
+        assert type(edge) is dict
+        json.dumps(edge)
+
+    with_client(body)
+
+
+def test_lazy_reads_return_views_matching_to_dict(with_client: Any) -> None:
+    async def body(c: StardustClient) -> None:
+        ids, eids = await _triangle(c)
+        node = await c.get_node(ids[1])
+        assert isinstance(node, NodeView)
+        assert node.id == ids[1] and node.labels == ["N"]
+        assert node.hot_props == {"i": 1}
+        assert isinstance(node["header"], ReaderView)
+        assert isinstance(node["header"]["labels"]["names"], ListView)
+        assert node["header"]["labels"]["names"] == ["N"]
+        assert dict(node["header"]).keys() == node.to_dict()["header"].keys()
+        with pytest.raises(KeyError):
+            node["missing"]
+
+        edge = await c.get_edge(eids[0])
+        assert isinstance(edge, ReaderView)
+        assert edge["meta"]["type"] == "NEXT"
+        # views are not JSON; to_dict() is
+        with pytest.raises(TypeError):
+            json.dumps(edge)
+        assert json.loads(json.dumps(edge.to_dict()))["edge"]["src"] == ids[0]
+
+    with_client(body, lazy_reads=True)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_batch_reads_are_one_rpc_in_request_order(
+    db: MockStardust, with_client: Any, lazy: bool
+) -> None:
+    async def body(c: StardustClient) -> None:
+        ids, eids = await _triangle(c)
+        headers = await c.get_nodes(list(reversed(ids)))
+        assert [h["id"] for h in headers] == list(reversed(ids))
+        edges = await c.get_edges(eids[::-1])
+        assert [e["edge"]["id"] for e in edges] == eids[::-1]
+        assert [e["meta"]["type"] for e in edges] == ["NEXT"] * 3
+
+    with_client(body, lazy_reads=lazy)
+    assert db.calls["getNodesBatch"] == 1 and db.calls["getEdgesBatch"] == 1
+
+
+def test_list_adjacency_direction_and_limit(with_client: Any) -> None:
+    async def body(c: StardustClient) -> None:
+        ids, eids = await _triangle(c)
+        out = (await c.list_adjacency(ids[0], direction="out"))["items"]
+        assert [(r["neighbor"], r["edgeId"], r["direction"]) for r in out] == [
+            (ids[1], eids[0], "out")
+        ]
+        inn = (await c.list_adjacency(ids[0], direction="in"))["items"]
+        assert [(r["neighbor"], r["edgeId"]) for r in inn] == [(ids[2], eids[2])]
+        both = (await c.list_adjacency(ids[0], direction="both", limit=1))["items"]
+        assert len(both) == 1
+
+    with_client(body)
+
+
+def test_knn_arrays_match_knn(db: MockStardust, with_client: Any) -> None:
+    async def body(c: StardustClient) -> None:
+        await _triangle(c)
+        hits = await c.knn("text", [0.0, 1.0], k=2)
+        ids, scores = await c.knn_arrays("text", [0.0, 1.0], k=2)
+        assert ids.dtype == np.uint64 and scores.dtype == np.float32
+        assert ids.tolist() == [h.id for h in hits] == [3, 2]
+        assert scores.tolist() == pytest.approx([h.score for h in hits])
+
+    with_client(body)
+    assert db.calls["knn"] == 2
+
+
+def test_knn_arrays_keep_ids_above_int64_range(db: MockStardust, with_client: Any) -> None:
+    db._next_id = 2**63 + 5
+
+    async def body(c: StardustClient) -> None:
+        nid = (await c.create_node(vectors=[("text", [1.0])]))["node"]["id"]
+        ids, _ = await c.knn_arrays("text", [1.0], k=1)
+        assert ids.tolist() == [nid] == [2**63 + 5]
+
+    with_client(body)
+
+
+def test_knn_arrays_fall_back_to_hits(db: MockStardust, with_client: Any) -> None:
+    db.packed_knn = False
+
+    async def body(c: StardustClient) -> None:
+        await _triangle(c)
+        ids, scores = await c.knn_arrays("text", [0.0, 1.0], k=3)
+        assert ids.dtype == np.uint64 and ids.tolist() == [3, 2, 1]
+        assert scores.tolist() == pytest.approx([2.0, 1.0, 0.0])
+
+    with_client(body)
+
+
+def test_pool_round_robins_over_its_connections(db: MockStardust) -> None:
+    async def main() -> None:
+        async with serve(db) as url:
+            pool = await connect_pool(url, n=3, lazy_reads=True)
+            try:
+                assert len(pool) == 3
+                picked = {id(pool.client()) for _ in range(3)}
+                assert len(picked) == 3
+                nodes = [await pool.create_node(labels=[str(i)]) for i in range(6)]
+                got = [await pool.get_node(n["node"]["id"]) for n in nodes]
+                assert [g.labels for g in got] == [[str(i)] for i in range(6)]
+            finally:
+                await pool.aclose()
+
+    run(main())
+
+
+def test_connect_pool_rejects_empty_pool() -> None:
+    with pytest.raises(ValueError):
+        run(connect_pool("unix:/nonexistent", n=0))
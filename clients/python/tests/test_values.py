@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import enum
+from typing import Any
+
+import numpy as np
+import pytest
+
+from stardust.client import StardustClient
+
+
+class Color(enum.IntEnum):
+    RED = 1
+
+
+class Mode(enum.StrEnum):
+    FAST = "fast"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, {"nullv": None}),
+        (True, {"boolv": True}),
+        (False, {"boolv": False}),
+        (42, {"i64": 42}),
+        (-(2**63), {"i64": -(2**63)}),
+        (1.5, {"f64": 1.5}),
+        ("text", {"text": "text"}),
+        (b"\x00\xff", {"bytes": b"\x00\xff"}),
+        (bytearray(b"ab"), {"bytes": b"ab"}),
+        # subclasses go through the isinstance fallback
+        (Color.RED, {"i64": 1}),
+        (Mode.FAST, {"text": "fast"}),
+        (np.float64(2.5), {"f64": 2.5}),
+        # anything else is stored as its repr
+        ([1, 2], {"bytes": b"[1, 2]"}),
+        ({"a": 1}, {"bytes": b"{'a': 1}"}),
+    ],
+)
+def test_prop_values_encode_to_the_value_union(
+    with_client: Any, value: Any, expected: dict[str, Any]
+) -> None:
+    async def body(c: StardustClient) -> Any:
+        res = await c.create_node(hot_props={"k": value})
+        return (await c.get_node_props(res["node"]["id"]))["props"]
+
+    assert with_client(body) == [{"key": "k", "val": expected}]
+
+
+def test_edge_props_use_the_same_encoding(with_client: Any) -> None:
+    async def body(c: StardustClient) -> Any:
+        a = (await c.create_node())["node"]["id"]
+        b = (await c.create_node())["node"]["id"]
+        e = await c.add_edge(a, b, "KNOWS", {"since": 2020, "w": 0.5, "note": None})
+        return await c.get_edge(e["id"])
+
+    edge = with_client(body)
+    assert edge["meta"] == {
+        "type": "KNOWS",
+        "props": [
+            {"key": "since", "val": {"i64": 2020}},
+            {"key": "w", "val": {"f64": 0.5}},
+            {"key": "note", "val": {"nullv": None}},
+        ],
+    }
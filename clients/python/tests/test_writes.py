@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import numpy as np
+import pytest
+from mock_stardust import MockStardust
+
+from stardust.client import StardustClient
+
+
+def test_create_node_round_trip(db: MockStardust, with_client: Any) -> None:
+    async def body(c: StardustClient) -> None:
+        res = await c.create_node(
+            labels=["Person", "Actor"],
+            hot_props={"name": "Ada"},
+            cold_props={"bio": "long text"},
+            vectors=[("text", [1.0, 2.0, 3.0])],
+        )
+        nid = res["node"]["id"]
+        assert res["header"]["labels"]["names"] == ["Person", "Actor"]
+        props = await c.get_node_props(nid)
+        assert props["props"] == [
+            {"key": "name", "val": {"text": "Ada"}},
+            {"key": "bio", "val": {"text": "long text"}},
+        ]
+        vecs = await c.get_vectors(nid)
+        (tv,) = vecs["vectors"]
+        assert tv["tag"] == "text" and tv["vector"]["dim"] == 3
+
+    with_client(body)
+    assert np.frombuffer(db.vectors[(1, "text")], "<f4").tolist() == [1.0, 2.0, 3.0]
+
+
+def test_bulk_writes_keep_input_order(db: MockStardust, with_client: Any) -> None:
+    async def body(c: StardustClient) -> None:
+        nodes = await c.create_nodes_bulk([{"labels": [f"L{i}"]} for i in range(5)])
+        ids = [n["node"]["id"] for n in nodes]
+        assert [n["header"]["labels"]["names"] for n in nodes] == [[f"L{i}"] for i in range(5)]
+        edges = await c.add_edges_bulk([(ids[i], ids[i + 1], "NEXT", {"i": i}) for i in range(4)])
+        assert [(e["src"], e["dst"]) for e in edges] == list(zip(ids, ids[1:], strict=False))
+        await c.upsert_vectors_bulk([(nid, "t", [float(nid)]) for nid in ids])
+
+    with_client(body)
+    assert db.calls["createNode"] == 5 and db.calls["addEdge"] == 4
+    assert len(db.vectors) == 5
+
+
+@pytest.mark.parametrize("use_async_iter", [False, True])
+def test_stream_upsert_vectors(db: MockStardust, with_client: Any, use_async_iter: bool) -> None:
+    items = [(nid, "t", np.full(4, nid, dtype=np.float32)) for nid in range(1, 11)]
+
+    async def gen() -> AsyncIterator[tuple[int, str, Any]]:
+        for item in items:
+            yield item
+
+    async def body(c: StardustClient) -> int:
+        return await c.stream_upsert_vectors(gen() if use_async_iter else items, window=3)
+
+    assert with_client(body) == 10
+    assert db.calls["upsertVectorStream"] == 10
+    assert np.frombuffer(db.vectors[(7, "t")], "<f4").tolist() == [7.0] * 4
+
+
+def test_stream_upsert_vectors_rejects_empty_window(with_client: Any) -> None:
+    async def body(c: StardustClient) -> None:
+        with pytest.raises(ValueError):
+            await c.stream_upsert_vectors([], window=0)
+
+    with_client(body)
+
+
+@pytest.mark.parametrize(
+    "vector",
+    [
+        [0.5, -1.0, 2.0],
+        (0.5, -1.0, 2.0),
+        np.array([0.5, -1.0, 2.0], dtype=np.float64),
+        np.array([0.5, -1.0, 2.0], dtype=np.float32),
+        np.array([0.5, -1.0, 2.0], dtype="<f4").tobytes(),
+        bytearray(np.array([0.5, -1.0, 2.0], dtype="<f4").tobytes()),
+        memoryview(np.array([0.5, -1.0, 2.0], dtype=np.float32)),
+    ],
+)
+def test_upsert_vector_accepts_each_vector_form(
+    db: MockStardust, with_client: Any, vector: Any
+) -> None:
+    async def body(c: StardustClient) -> None:
+        await c.upsert_vector(1, "t", vector)
+
+    with_client(body)
+    assert np.frombuffer(db.vectors[(1, "t")], "<f4").tolist() == [0.5, -1.0, 2.0]
+
+
+@pytest.mark.parametrize(
+    "vector",
+    [
+        b"\x00" * 7,
+        memoryview(np.zeros(3, dtype=np.float64)),
+        memoryview(np.zeros(3, dtype=">f4")),
+    ],
+)
+def test_upsert_vector_rejects_non_float32_buffers(with_client: Any, vector: Any) -> None:
+    async def body(c: StardustClient) -> None:
+        with pytest.raises(ValueError):
+            await c.upsert_vector(1, "t", vector)
+
+    with_client(body)
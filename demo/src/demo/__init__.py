@@ -1,22 +1,38 @@
 from __future__ import annotations
 
 import asyncio
-import csv
-import gzip
 import os
-from collections import defaultdict
-from collections.abc import Iterable
+import shutil
+import sys
+import tempfile
+from collections.abc import Awaitable, Callable, Generator, Iterable
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.request import urlretrieve
 
 import aiohttp
 import capnp
+import polars as pl
 from dotenv import load_dotenv
 from ollama import Client as OllamaClient
 from stardust import connect
 
+try:
+    import rapidgzip
+
+    _HAVE_RAPIDGZIP = True
+except ImportError:  # optional extra: parallel gzip inflate
+    _HAVE_RAPIDGZIP = False
+
+# rapidgzip's sweet spot for per-thread chunks; also the copy size
+_RAPIDGZIP_CHUNK = 4 * 1024 * 1024
+
+# nodes/edges pipelined per bulk client call during ingest
+_BULK_CHUNK = 1024
+
 # IMDb dataset sources
 IMDB_TITLE_BASICS_URL = "https://datasets.imdbws.com/title.basics.tsv.gz"
 IMDB_TITLE_PRINCIPALS_URL = "https://datasets.imdbws.com/title.principals.tsv.gz"
@@ -37,7 +53,7 @@ def _get_ollama_client() -> OllamaClient:
     return _OLLAMA_CLIENT
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Movie:
     tconst: str
     title: str
@@ -48,7 +64,7 @@ class Movie:
     runtime_minutes: int | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Person:
     nconst: str
     name: str
@@ -58,23 +74,38 @@ class Person:
     primary_professions: tuple[str, ...]
 
 
-@dataclass(frozen=True)
-class Principal:
-    nconst: str
-    ordering: int
-    category: str
-    job: str | None
-    characters: str | None
+@dataclass(frozen=True, slots=True)
+class Principals:
+    """Principals of many titles as flat parallel columns (CSR layout).
+
+    Each title's rows are contiguous and in IMDb ordering; `spans` maps a
+    tconst to its [start, stop) range in the columns.
+    """
+
+    spans: dict[str, tuple[int, int]]
+    nconsts: list[str]
+    orderings: list[int]
+    categories: list[str]
+    jobs: list[str | None]
+    characters: list[str | None]
+
+    def span(self, tconst: str) -> range:
+        return range(*self.spans.get(tconst, (0, 0)))
 
 
-def _safe_text(value: str | None, max_len: int = 200) -> str:
+def _safe200(value: str | None) -> str:
     if not value:
         return ""
-    if len(value) <= max_len:
-        return value
-    return value[: max_len - 1] + "…"
+    return value if len(value) <= 200 else value[:199] + "…"
 
 
+def _safe32(value: str | None) -> str:
+    if not value:
+        return ""
+    return value if len(value) <= 32 else value[:31] + "…"
+
+
+@lru_cache(maxsize=1)
 def _find_or_create_data_dir() -> Path:
     env_dir = os.environ.get("STARDUST_DATA_DIR")
     if env_dir:
@@ -97,195 +128,225 @@ def _download_if_needed(url: str, dest: Path) -> Path:
     return dest
 
 
-def _iter_tsv(path: Path) -> Iterable[list[str]]:
-    with gzip.open(path, mode="rt", encoding="utf-8", newline="") as f:
-        reader = csv.reader(f, delimiter="\t")
-        # Skip header row
-        header_skipped = False
-        for row in reader:
-            if not header_skipped:
-                header_skipped = True
-                continue
-            yield row
-
-
-def _load_ratings(ratings_path: Path) -> dict[str, tuple[float, int]]:
-    """Return mapping tconst -> (averageRating, numVotes)."""
-    result: dict[str, tuple[float, int]] = {}
-    for row in _iter_tsv(ratings_path):
-        # tconst, averageRating, numVotes
-        if len(row) < 3:
-            continue
-        tconst, avg_str, votes_str = row
-        try:
-            avg = float(avg_str)
-            votes = int(votes_str)
-        except ValueError:
-            continue
-        result[tconst] = (avg, votes)
-    return result
+@contextmanager
+def _tsv_sources(paths: list[Path]) -> Generator[list[Path], None, None]:
+    """Yield the file Polars should scan for each of `paths`.
 
+    With rapidgzip installed, each .tsv.gz is inflated across all cores into a
+    plain .tsv that Polars can scan in parallel. The copies go in a scratch dir
+    removed on exit, as they run to several GB; with DEMO_KEEP_TSV=1 they are
+    written next to the .gz instead and reused by later runs. Without rapidgzip
+    Polars inflates the .gz itself, single-threaded.
+    """
+    if not _HAVE_RAPIDGZIP:
+        yield paths
+        return
+    keep = os.environ.get("DEMO_KEEP_TSV", "0") == "1"
+    # scratch lives beside the data rather than in /tmp, which is often RAM-backed
+    with tempfile.TemporaryDirectory(prefix=".inflate-", dir=paths[0].parent) as scratch:
+        yield [_inflate(p, p.parent if keep else Path(scratch)) for p in paths]
+
+
+def _inflate(path: Path, dest_dir: Path) -> Path:
+    if path.suffix != ".gz":
+        return path
+    plain = dest_dir / path.with_suffix("").name
+    if plain.exists() and plain.stat().st_mtime >= path.stat().st_mtime:
+        return plain
+    print(f"Decompressing {path} -> {plain} ...")
+    tmp_path = plain.with_suffix(plain.suffix + ".tmp")
+    with (
+        rapidgzip.RapidgzipFile(
+            path.as_posix(), parallelization=os.cpu_count() or 0, chunk_size=_RAPIDGZIP_CHUNK
+        ) as src,
+        tmp_path.open("wb") as dst,
+    ):
+        shutil.copyfileobj(src, dst, _RAPIDGZIP_CHUNK)
+    tmp_path.replace(plain)
+    return plain
+
+
+def _scan_tsv(path: Path) -> pl.LazyFrame:
+    # IMDb TSVs use "\N" for missing values and never quote fields (a '"' is
+    # literal title text), so quoting is off. Columns come back as text and
+    # each loader casts what it needs, turning unparsable values into nulls.
+    return pl.scan_csv(
+        path,
+        separator="\t",
+        quote_char=None,
+        null_values="\\N",
+        infer_schema=False,
+        truncate_ragged_lines=True,
+    )
 
-def _load_movies(basics_path: Path, ratings_path: Path, max_movies: int) -> list[Movie]:
-    ratings = _load_ratings(ratings_path)
-    candidates: list[tuple[int, float, int, str, str, str | None, int | None]] = []
-    # (numVotes, avgRating, year, tconst, title, genres, runtimeMinutes)
-
-    for row in _iter_tsv(basics_path):
-        # tconst, titleType, primaryTitle, originalTitle,
-        # isAdult, startYear, endYear, runtimeMinutes, genres
-        if len(row) < 9:
-            continue
-        (
-            tconst,
-            title_type,
-            primary_title,
-            _original_title,
-            is_adult,
-            start_year,
-            _end_year,
-            runtime_minutes,
-            genres,
-        ) = row[:9]
-        if title_type != "movie" or is_adult == "1" or start_year == "\\N":
-            continue
-        try:
-            year = int(start_year)
-        except ValueError:
-            continue
 
-        avg, votes = ratings.get(tconst, (0.0, 0))
-        rt: int | None
-        try:
-            rt = int(runtime_minutes) if runtime_minutes != "\\N" else None
-        except ValueError:
-            rt = None
-        genres_str = None if genres == "\\N" else genres
-        candidates.append((votes, avg, year, tconst, primary_title, genres_str, rt))
-
-    # sort by popularity: votes desc, rating desc, year desc
-    candidates.sort(key=lambda x: (x[0], x[1], x[2]), reverse=True)
-    top = candidates[:max_movies]
+def _load_ratings(ratings_path: Path) -> pl.LazyFrame:
+    """Return frame keyed by tconst with (averageRating, numVotes)."""
+    return (
+        _scan_tsv(ratings_path)
+        .select(
+            "tconst",
+            pl.col("averageRating").cast(pl.Float64, strict=False),
+            pl.col("numVotes").cast(pl.Int64, strict=False),
+        )
+        .drop_nulls()
+    )
+
+
+def _load_movies(basics_path: Path, ratings_path: Path, max_movies: int) -> list[Movie]:
+    top = (
+        _scan_tsv(basics_path)
+        .with_row_index("row")
+        .filter((pl.col("titleType") == "movie") & pl.col("isAdult").ne_missing("1"))
+        .select(
+            "row",
+            "tconst",
+            "primaryTitle",
+            pl.col("startYear").cast(pl.Int64, strict=False),
+            pl.col("runtimeMinutes").cast(pl.Int64, strict=False),
+            "genres",
+        )
+        .drop_nulls("startYear")
+        .join(_load_ratings(ratings_path), on="tconst", how="left")
+        .with_columns(
+            pl.col("averageRating").fill_null(0.0),
+            pl.col("numVotes").fill_null(0),
+        )
+        # sort by popularity: votes desc, rating desc, year desc (file order on ties);
+        # with the head() below Polars plans this as a bounded top-k sort, so only
+        # max_movies candidates are kept rather than sorting every movie
+        .sort(
+            ["numVotes", "averageRating", "startYear", "row"],
+            descending=[True, True, True, False],
+        )
+        .head(max_movies)
+        .collect(engine="streaming")
+    )
     return [
         Movie(
-            tconst=t,
-            title=title,
-            year=yr,
-            avg_rating=a,
-            num_votes=v,
-            genres=g,
-            runtime_minutes=rt,
+            tconst=r["tconst"],
+            title=r["primaryTitle"],
+            year=r["startYear"],
+            avg_rating=r["averageRating"],
+            num_votes=r["numVotes"],
+            genres=sys.intern(r["genres"]) if r["genres"] else r["genres"],
+            runtime_minutes=r["runtimeMinutes"],
         )
-        for v, a, yr, t, title, g, rt in top
+        for r in top.iter_rows(named=True)
     ]
 
 
+def _principals_csr(rows: pl.DataFrame) -> Principals:
+    # rows arrive grouped by title, so consecutive run lengths give the spans
+    spans: dict[str, tuple[int, int]] = {}
+    start = 0
+    for tconst, n in rows.group_by("tconst", maintain_order=True).len().iter_rows():
+        spans[tconst] = (start, start + n)
+        start += n
+    return Principals(
+        spans,
+        rows["nconst"].to_list(),
+        rows["ordering"].to_list(),
+        [sys.intern(c) for c in rows["category"].to_list()],
+        rows["job"].to_list(),
+        rows["characters"].to_list(),
+    )
+
+
 def _load_principals(
     principals_path: Path,
     movie_ids: set[str],
-) -> tuple[dict[str, list[Principal]], dict[str, list[Principal]]]:
-    actors_by_title: dict[str, list[Principal]] = defaultdict(list)
-    directors_by_title: dict[str, list[Principal]] = defaultdict(list)
-    for row in _iter_tsv(principals_path):
-        # tconst, ordering, nconst, category, job, characters
-        if len(row) < 6:
-            continue
-        tconst, ordering_str, nconst, category, job, characters = row
-        if tconst not in movie_ids:
-            continue
-        try:
-            ordering = int(ordering_str)
-        except ValueError:
-            ordering = 999999
-
-        def _parse_characters(raw: str) -> str | None:
-            if not raw or raw == "\\N":
-                return None
-            s = raw.strip()
-            if s.startswith("[") and s.endswith("]"):
-                try:
-                    import json
-
-                    arr = json.loads(s)
-                    if isinstance(arr, list) and arr:
-                        first = arr[0]
-                        return str(first)
-                except (json.JSONDecodeError, TypeError, ValueError):
-                    pass
-            return s
-
-        principal = Principal(
-            nconst=nconst,
-            ordering=ordering,
-            category=category,
-            job=None if job == "\\N" else job,
-            characters=_parse_characters(characters),
+) -> tuple[Principals, Principals]:
+    """Return (actors, directors) for the given titles."""
+    rows = (
+        _scan_tsv(principals_path)
+        .filter(
+            pl.col("tconst").is_in(pl.Series(list(movie_ids), dtype=pl.String))
+            & pl.col("category").is_in(["actor", "actress", "director"])
         )
-
-        if category in ("actor", "actress"):
-            actors_by_title[tconst].append(principal)
-        elif category == "director":
-            directors_by_title[tconst].append(principal)
-
-    # sort by IMDb ordering as a baseline
-    for lst in actors_by_title.values():
-        lst.sort(key=lambda p: p.ordering)
-    for lst in directors_by_title.values():
-        lst.sort(key=lambda p: p.ordering)
-
-    return actors_by_title, directors_by_title
+        .with_columns(
+            pl.col("ordering").cast(pl.Int64, strict=False).fill_null(999999),
+            # characters is a JSON list like ["Neo"]; keep its first entry, or
+            # the raw text when it isn't valid JSON
+            pl.coalesce(
+                pl.col("characters").str.strip_chars().str.json_path_match("$[0]"),
+                pl.col("characters").str.strip_chars(),
+            ),
+        )
+        # stable sort by IMDb ordering as a baseline; keeps file order per title
+        .sort("ordering", maintain_order=True)
+        .collect(engine="streaming")
+        # stable again: make each title's rows contiguous, keeping their order
+        .sort("tconst", maintain_order=True)
+    )
+    is_director = pl.col("category") == "director"
+    return _principals_csr(rows.filter(~is_director)), _principals_csr(rows.filter(is_director))
 
 
 def _load_people(
     names_path: Path, nconsts: set[str]
 ) -> dict[str, tuple[str, int | None, int | None, tuple[str, ...]]]:
     """Return mapping nconst -> (primaryName, birthYear, deathYear, professions)."""
-    needed = set(nconsts)
     result: dict[str, tuple[str, int | None, int | None, tuple[str, ...]]] = {}
-    if not needed:
+    if not nconsts:
         return result
-    for row in _iter_tsv(names_path):
-        # nconst, primaryName, birthYear, deathYear, primaryProfession, knownForTitles
-        if len(row) < 6:
-            continue
-        nconst, primary_name, birth_year, death_year, primary_profession, _known_for = row[:6]
-        if nconst in needed:
-            by: int | None
-            dy: int | None
-            try:
-                by = int(birth_year) if birth_year != "\\N" else None
-            except ValueError:
-                by = None
-            try:
-                dy = int(death_year) if death_year != "\\N" else None
-            except ValueError:
-                dy = None
-            profs: tuple[str, ...] = tuple(
-                p.strip()
-                for p in (
-                    primary_profession.split(",")
-                    if primary_profession and primary_profession != "\\N"
-                    else []
-                )
-                if p.strip()
-            )
-            result[nconst] = (primary_name, by, dy, profs)
-            if len(result) >= len(needed):
-                break
+    rows = (
+        _scan_tsv(names_path)
+        .filter(pl.col("nconst").is_in(pl.Series(list(nconsts), dtype=pl.String)))
+        .select(
+            "nconst",
+            pl.col("primaryName").fill_null(""),
+            pl.col("birthYear").cast(pl.Int64, strict=False),
+            pl.col("deathYear").cast(pl.Int64, strict=False),
+            "primaryProfession",
+        )
+        .collect(engine="streaming")
+    )
+    for nconst, primary_name, by, dy, primary_profession in rows.iter_rows():
+        profs: tuple[str, ...] = tuple(
+            sys.intern(p.strip())
+            for p in (primary_profession.split(",") if primary_profession else [])
+            if p.strip()
+        )
+        result[nconst] = (primary_name, by, dy, profs)
     return result
 
 
 async def _bounded_gather(
-    coros: list[Any],
+    fn: Callable[..., Awaitable[Any]],
+    items: Iterable[tuple[Any, ...]],
     limit: int = 50,
 ) -> list[Any]:
-    semaphore = asyncio.Semaphore(limit)
-
-    async def _wrap(coro: Any) -> Any:
-        async with semaphore:
-            return await coro
-
-    return await asyncio.gather(*[_wrap(c) for c in coros])
+    """Await fn(*args) for each args tuple with at most `limit` in flight.
+
+    Arguments are fed through a bounded queue to `limit` workers, so only
+    O(limit) coroutines exist at once however long `items` is. Results come
+    back in input order.
+    """
+    queue: asyncio.Queue[tuple[int, tuple[Any, ...]] | None] = asyncio.Queue(maxsize=limit * 2)
+    results: dict[int, Any] = {}
+
+    async def _worker() -> None:
+        while (job := await queue.get()) is not None:
+            i, args = job
+            results[i] = await fn(*args)
+
+    async with asyncio.TaskGroup() as tg:
+        for _ in range(limit):
+            tg.create_task(_worker())
+        for job in enumerate(items):
+            await queue.put(job)
+        for _ in range(limit):
+            await queue.put(None)
+    return [results[i] for i in range(len(results))]
+
+
+async def _bulk(call: Any, items: list[Any], chunk: int = _BULK_CHUNK) -> list[Any]:
+    """Run a bulk client call over `items` in chunks, keeping input order."""
+    out: list[Any] = []
+    for i in range(0, len(items), chunk):
+        out.extend(await call(items[i : i + chunk]))
+    return out
 
 
 async def _fetch_omdb_plot(session: aiohttp.ClientSession, tconst: str) -> str | None:
@@ -343,42 +404,45 @@ async def main_async() -> None:
     names_gz = data_dir / "name.basics.tsv.gz"
     ratings_gz = data_dir / "title.ratings.tsv.gz"
 
-    _download_if_needed(IMDB_TITLE_BASICS_URL, basics_gz)
-    _download_if_needed(IMDB_TITLE_PRINCIPALS_URL, principals_gz)
-    _download_if_needed(IMDB_NAME_BASICS_URL, names_gz)
-    _download_if_needed(IMDB_TITLE_RATINGS_URL, ratings_gz)
+    # independent files: fetch them side by side instead of one after another
+    await asyncio.gather(
+        asyncio.to_thread(_download_if_needed, IMDB_TITLE_BASICS_URL, basics_gz),
+        asyncio.to_thread(_download_if_needed, IMDB_TITLE_PRINCIPALS_URL, principals_gz),
+        asyncio.to_thread(_download_if_needed, IMDB_NAME_BASICS_URL, names_gz),
+        asyncio.to_thread(_download_if_needed, IMDB_TITLE_RATINGS_URL, ratings_gz),
+    )
 
     max_movies = int(os.environ.get("DEMO_MAX_MOVIES", "500"))
 
-    print(f"Loading up to {max_movies} most popular movies using {basics_gz} + ratings ...")
-    movies = _load_movies(basics_gz, ratings_gz, max_movies=max_movies)
-    movie_ids = {m.tconst for m in movies}
-
-    print("Loading principals (actors/directors) ...")
-    actors_by_title, directors_by_title = _load_principals(
-        principals_gz,
-        movie_ids=movie_ids,
-    )
-
-    all_people_ids: set[str] = set()
-    for principals in actors_by_title.values():
-        all_people_ids.update(p.nconst for p in principals)
-    for principals in directors_by_title.values():
-        all_people_ids.update(p.nconst for p in principals)
+    with _tsv_sources([basics_gz, ratings_gz, principals_gz, names_gz]) as (
+        basics_tsv,
+        ratings_tsv,
+        principals_tsv,
+        names_tsv,
+    ):
+        print(f"Loading up to {max_movies} most popular movies using {basics_gz} + ratings ...")
+        movies = _load_movies(basics_tsv, ratings_tsv, max_movies=max_movies)
+        movie_ids = {m.tconst for m in movies}
+
+        print("Loading principals (actors/directors) ...")
+        actors, directors = _load_principals(
+            principals_tsv,
+            movie_ids=movie_ids,
+        )
 
-    selected_actors_by_title: dict[str, list[Principal]] = actors_by_title
-    selected_directors_by_title: dict[str, list[Principal]] = directors_by_title
+        actor_ids = set(actors.nconsts)
+        director_ids = set(directors.nconsts)
+        all_people_ids = actor_ids | director_ids
 
-    print(f"Resolving {len(all_people_ids)} people names ...")
-    nconst_to_details = _load_people(names_gz, all_people_ids)
+        print(f"Resolving {len(all_people_ids)} people names ...")
+        nconst_to_details = _load_people(names_tsv, all_people_ids)
 
-    person_roles: dict[str, set[str]] = defaultdict(set)
-    for principals in selected_actors_by_title.values():
-        for p in principals:
-            person_roles[p.nconst].add("Actor")
-    for principals in selected_directors_by_title.values():
-        for p in principals:
-            person_roles[p.nconst].add("Director")
+    # everyone is an actor, a director or both; share the three role sets
+    role_sets = {
+        (True, False): frozenset({"Actor"}),
+        (False, True): frozenset({"Director"}),
+        (True, True): frozenset({"Actor", "Director"}),
+    }
 
     people: dict[str, Person] = {}
     for nconst in all_people_ids:
@@ -386,7 +450,9 @@ async def main_async() -> None:
         if not details:
             continue
         name, birth_year, death_year, professions = details
-        roles = frozenset(person_roles.get(nconst, set()) or {"Person"})
+        roles = role_sets.get(
+            (nconst in actor_ids, nconst in director_ids), frozenset({"Person"})
+        )
         people[nconst] = Person(
             nconst=nconst,
             name=name,
@@ -398,22 +464,22 @@ async def main_async() -> None:
 
     print(f"Creating {len(movies)} movie nodes and {len(people)} person nodes ...")
 
-    create_movie_tasks = [
-        client.create_node(
+    movie_specs = [
+        dict(
             labels=["Movie"],
             hot_props={
-                "title": _safe_text(m.title, 200),
+                "title": _safe200(m.title),
                 "year": m.year,
-                "tconst": _safe_text(m.tconst, 32),
+                "tconst": _safe32(m.tconst),
                 "avgRating": m.avg_rating,
                 "numVotes": m.num_votes,
-                "genres": _safe_text(m.genres or "", 200),
+                "genres": _safe200(m.genres),
                 "runtimeMinutes": m.runtime_minutes if m.runtime_minutes is not None else 0,
             },
         )
         for m in movies
     ]
-    movie_results = await _bounded_gather(create_movie_tasks, limit=50)
+    movie_results = await _bulk(client.create_nodes_bulk, movie_specs)
     movie_id_map: dict[str, int] = {}
     for m, res in zip(movies, movie_results, strict=False):
         movie_id_map[m.tconst] = int(res["node"]["id"])  # type: ignore[index]
@@ -421,71 +487,74 @@ async def main_async() -> None:
     if OMDB_API_KEY:
         print("Augmenting movies with OMDb plot embeddings via Ollama ...")
         async with aiohttp.ClientSession() as session:
-            aug_tasks = [
-                _augment_movie_plot(client, session, m, movie_id_map[m.tconst])
-                for m in movies
-                if m.tconst in movie_id_map
-            ]
-            await _bounded_gather(aug_tasks, limit=8)
-
-    create_person_tasks = []
+            await _bounded_gather(
+                _augment_movie_plot,
+                (
+                    (client, session, m, movie_id_map[m.tconst])
+                    for m in movies
+                    if m.tconst in movie_id_map
+                ),
+                limit=8,
+            )
+
+    person_specs = []
     for person in people.values():
         labels = ["Person", *sorted(role for role in person.roles if role != "Person")]
-        create_person_tasks.append(
-            client.create_node(
+        person_specs.append(
+            dict(
                 labels=labels,
                 hot_props={
-                    "name": _safe_text(person.name, 200),
-                    "nconst": _safe_text(person.nconst, 32),
+                    "name": _safe200(person.name),
+                    "nconst": _safe32(person.nconst),
                     "birthYear": person.birth_year if person.birth_year is not None else 0,
                     "deathYear": person.death_year if person.death_year is not None else 0,
-                    "primaryProfession": _safe_text(",".join(person.primary_professions), 200),
+                    "primaryProfession": _safe200(",".join(person.primary_professions)),
                 },
             )
         )
-    person_results = await _bounded_gather(create_person_tasks, limit=50)
+    person_results = await _bulk(client.create_nodes_bulk, person_specs)
     person_id_map: dict[str, int] = {}
     for person, res in zip(people.values(), person_results, strict=False):
         person_id_map[person.nconst] = int(res["node"]["id"])  # type: ignore[index]
 
     print("Creating relationships ...")
-    edge_tasks = []
+    edges: list[tuple[int, int, str, dict[str, Any]]] = []
     for movie in movies:
         tconst = movie.tconst
-        for principal in selected_actors_by_title.get(tconst, []):
-            nconst = principal.nconst
+        for i in actors.span(tconst):
+            nconst = actors.nconsts[i]
             if nconst in person_id_map:
-                edge_tasks.append(
-                    client.add_edge(
-                        src=person_id_map[nconst],
-                        dst=movie_id_map[tconst],
-                        edge_type="ACTED_IN",
-                        props={
-                            "role": _safe_text(principal.characters or "", 200),
-                            "ordering": int(principal.ordering),
-                            "category": _safe_text(principal.category, 32),
+                edges.append(
+                    (
+                        person_id_map[nconst],
+                        movie_id_map[tconst],
+                        "ACTED_IN",
+                        {
+                            "role": _safe200(actors.characters[i]),
+                            "ordering": actors.orderings[i],
+                            "category": _safe32(actors.categories[i]),
                         },
                     )
                 )
-        for principal in selected_directors_by_title.get(tconst, []):
-            nconst = principal.nconst
+        for i in directors.span(tconst):
+            nconst = directors.nconsts[i]
             if nconst in person_id_map:
-                edge_tasks.append(
-                    client.add_edge(
-                        src=person_id_map[nconst],
-                        dst=movie_id_map[tconst],
-                        edge_type="DIRECTED",
-                        props={
-                            "ordering": int(principal.ordering),
-                            "job": _safe_text(principal.job or "", 200),
+                edges.append(
+                    (
+                        person_id_map[nconst],
+                        movie_id_map[tconst],
+                        "DIRECTED",
+                        {
+                            "ordering": directors.orderings[i],
+                            "job": _safe200(directors.jobs[i]),
                         },
                     )
                 )
 
-    _ = await _bounded_gather(edge_tasks, limit=100)
+    await _bulk(client.add_edges_bulk, edges)
 
     sample_count = min(5, len(movies))
-    print(f"Done. Created {len(movies)} movies, {len(people)} people, and {len(edge_tasks)} edges.")
+    print(f"Done. Created {len(movies)} movies, {len(people)} people, and {len(edges)} edges.")
     print(f"Sample of {sample_count} movies with adjacency:")
     for movie in movies[:sample_count]:
         node_id = movie_id_map[movie.tconst]
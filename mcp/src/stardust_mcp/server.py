@@ -2,21 +2,99 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
+import json
 import logging
 import os
+import sys
+import time
 import uuid
+from array import array
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable, Iterator, Mapping
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, Optional, TypedDict, Literal, cast
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Generic, Literal, TypedDict, TypeVar, cast
 
+import capnp
+import numpy as np
+from fastmcp import Context, FastMCP
+from numpy.typing import NDArray
 from ollama import AsyncClient as OllamaAsyncClient
-
-from fastmcp import FastMCP, Context
-
 from stardust import connect as sd_connect
-import capnp
+
+try:
+    import orjson
+except ImportError:  # optional, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
 
 logging.basicConfig(level=logging.INFO)
 
+K = TypeVar("K")
+V = TypeVar("V")
+
+# max Stardust RPCs in flight while expanding a subgraph
+_RPC_CONCURRENCY = 32
+# max nodes being read (header + props) at once for a subgraph payload
+_NODE_FETCH_CONCURRENCY = 64
+# max edge ids per get_edges batch RPC
+_EDGE_BATCH = 256
+# what a single Stardust RPC fails with: a server-side error or a dropped connection
+_RPC_ERRORS = (capnp.KjException, OSError)
+
+# model -> embedding dimension, remembered across restarts
+_DIMS_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME", "~/.cache")).expanduser()
+    / "stardust"
+    / "ollama-dims.json"
+)
+
+
+def _load_dims_cache() -> dict[str, int]:
+    try:
+        data = json.loads(_DIMS_CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    return {str(k): int(v) for k, v in data.items()} if isinstance(data, dict) else {}
+
+
+def _save_dim(model: str, dim: int) -> None:
+    dims = _load_dims_cache()
+    if dims.get(model) == dim:
+        return
+    dims[model] = dim
+    try:
+        _DIMS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _DIMS_CACHE_PATH.write_text(json.dumps(dims))
+    except OSError:
+        logging.debug("Could not write %s", _DIMS_CACHE_PATH)
+
+
+# embeddings are float32 arrays, the layout Stardust stores and sends them in
+Vector = NDArray[np.float32]
+
+
+def _knn_key(tag: str, qvec: Vector, k: int) -> tuple[str, bytes, int]:
+    # rounding to 3 decimals lets near-identical query vectors share an entry
+    rounded = qvec.round(3)
+    return (tag, hashlib.blake2b(rounded.tobytes(), digest_size=8).digest(), k)
+
+
+def _json_default(obj: Any) -> str:
+    # bytes props (including the repr bytes the client stores for values it has
+    # no Value field for) go out as text; undecodable bytes become U+FFFD
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).decode("utf-8", "replace")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default).decode()
+    return json.dumps(obj, default=_json_default)
+
 
 class NodeOut(TypedDict):
     id: int
@@ -32,6 +110,172 @@ class EdgeOut(TypedDict):
     props: dict[str, Any]
 
 
+# (id, src, dst, type, props), as stored by _EdgeTable.add
+EdgeRow = tuple[int, int, int, str, dict[str, Any]]
+# (neighbour id, edge id, edge row if the reply carried the edge inline)
+AdjRow = tuple[int | None, int, EdgeRow | None]
+
+
+def _plain(val: Any) -> Any:
+    # client reads return lazy reader views; payloads must stay plain dicts
+    to_dict = getattr(val, "to_dict", None)
+    return to_dict() if callable(to_dict) else val
+
+
+_key_val = itemgetter("key", "val")
+
+
+def _props_dict(props: Iterable[Mapping[str, Any]] | None) -> dict[str, Any]:
+    """Property list ([{key, val}, ...]) to a plain dict.
+
+    Keys repeat across nodes and edges, so they are interned: each key string
+    is kept once however many props use it.
+    """
+    out: dict[str, Any] = {}
+    if not props:
+        return out
+    for p in props:
+        try:
+            key, val = _key_val(p)
+        except KeyError:  # unset fields are absent from reader views
+            key, val = p.get("key"), p.get("val")
+        if key is not None:
+            out[sys.intern(str(key))] = _plain(val)
+    return out
+
+
+class _EdgeTable:
+    """Edges collected during expansion, stored column-wise.
+
+    Ids and endpoints live in unsigned 64-bit arrays and each type string is
+    stored once; EdgeOut dicts are only built by to_list() for the payload.
+    """
+
+    __slots__ = ("_index", "_type_ids", "dst", "ids", "props", "src", "type_idx", "types")
+
+    def __init__(self) -> None:
+        self._index: dict[int, int] = {}
+        self.ids = array("Q")
+        self.src = array("Q")
+        self.dst = array("Q")
+        self.type_idx = array("I")
+        self.types: list[str] = []
+        self._type_ids: dict[str, int] = {}
+        self.props: list[dict[str, Any]] = []
+
+    def __contains__(self, eid: int) -> bool:
+        return eid in self._index
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, eid: int, src: int, dst: int, type_: str, props: dict[str, Any]) -> None:
+        if eid in self._index:
+            return
+        t = self._type_ids.get(type_)
+        if t is None:
+            t = self._type_ids[type_] = len(self.types)
+            self.types.append(type_)
+        self._index[eid] = len(self.ids)
+        self.ids.append(eid)
+        self.src.append(src)
+        self.dst.append(dst)
+        self.type_idx.append(t)
+        self.props.append(props)
+
+    def to_list(self) -> list[EdgeOut]:
+        types = self.types
+        return [
+            {"id": i, "src": s, "dst": d, "type": types[t], "props": p}
+            for i, s, d, t, p in zip(
+                self.ids, self.src, self.dst, self.type_idx, self.props, strict=True
+            )
+        ]
+
+
+# characters of each node's props shown in a subgraph preview line
+_PREVIEW_CHARS = 300
+
+
+def _repr_prefix(v: str | bytes, limit: int) -> str:
+    # repr() picks its quote from the whole value, so carry over which quote
+    # characters v contains; the first `limit` chars then match repr(v)
+    if isinstance(v, str):
+        tail = ("'" if "'" in v else "") + ('"' if '"' in v else "")
+        return repr(v[:limit] + tail)
+    btail = (b"'" if b"'" in v else b"") + (b'"' if b'"' in v else b"")
+    return repr(v[:limit] + btail)
+
+
+def _repr_pieces(v: Any, limit: int) -> Iterator[str]:
+    if type(v) is dict:
+        yield "{"
+        for i, (k, x) in enumerate(v.items()):
+            if i:
+                yield ", "
+            yield from _repr_pieces(k, limit)
+            yield ": "
+            yield from _repr_pieces(x, limit)
+        yield "}"
+    elif type(v) is list:
+        yield "["
+        for i, x in enumerate(v):
+            if i:
+                yield ", "
+            yield from _repr_pieces(x, limit)
+        yield "]"
+    elif type(v) in (str, bytes) and len(v) > limit:
+        yield _repr_prefix(v, limit)
+    else:
+        yield repr(v)
+
+
+def _bounded_str(v: Any, limit: int = _PREVIEW_CHARS) -> str:
+    """Return str(v)[:limit] without rendering the rest of v."""
+    out: list[str] = []
+    n = 0
+    for piece in _repr_pieces(v, limit):
+        out.append(piece)
+        n += len(piece)
+        if n >= limit:
+            break
+    return "".join(out)[:limit]
+
+
+def _build_payload(
+    seeds: list[int],
+    hops: int,
+    nodes: list[NodeOut],
+    edges: list[EdgeOut],
+    topk: list[dict[str, Any]],
+    *,
+    vector_tag: str | None = None,
+    scores: dict[int, float] | None = None,
+) -> tuple[str, str]:
+    """Assemble a stored subgraph payload and its key.
+
+    The payload is returned already serialized to JSON. This is pure CPU work
+    (preview rendering and encoding), so tools run it in a worker thread to
+    keep the event loop free for other requests.
+    """
+    preview_lines: list[str] = []
+    for n in nodes[:20]:
+        label = f" ({', '.join(n['labels'])})" if n["labels"] else ""
+        s = scores.get(int(n["id"])) if scores is not None else None
+        score_txt = f" [score={s:.3f}]" if s is not None else ""
+        preview_lines.append(f"- Node {n['id']}{label}{score_txt}: {_bounded_str(n['props'])}")
+
+    payload: dict[str, Any] = {"type": "stardust-subgraph", "seeds": seeds}
+    if vector_tag is not None:
+        payload["vector_tag"] = vector_tag
+    payload["hops"] = hops
+    payload["nodes"] = nodes
+    payload["edges"] = edges
+    payload["topk"] = topk
+    payload["preview_markdown"] = "# Subgraph Preview\n" + "\n".join(preview_lines)
+    return str(uuid.uuid4()), _dumps(payload)
+
+
 class RAGResult(TypedDict):
     resource_uri: str
     seed_ids: list[int]
@@ -42,30 +286,241 @@ class RAGResult(TypedDict):
 
 
 class Embedder:
-    async def embed(self, text: str) -> list[float]:
+    async def embed(self, text: str) -> Vector:
         raise NotImplementedError
 
+    async def embed_batch(self, texts: list[str]) -> list[Vector]:
+        return list(await asyncio.gather(*(self.embed(t) for t in texts)))
+
+    @property
+    def dim(self) -> int | None:
+        return None
+
+    async def warmup(self) -> None:
+        return None
+
+    async def aclose(self) -> None:
+        return None
+
+
+# base_url -> [shared Ollama client, number of open embedders using it]
+_OLLAMA_CLIENTS: dict[str, list[Any]] = {}
+
+
+def _acquire_ollama_client(base_url: str) -> Any:
+    entry = _OLLAMA_CLIENTS.get(base_url)
+    if entry is None:
+        entry = _OLLAMA_CLIENTS[base_url] = [OllamaAsyncClient(host=base_url), 0]
+    entry[1] += 1
+    return entry[0]
+
+
+async def _release_ollama_client(base_url: str) -> None:
+    entry = _OLLAMA_CLIENTS.get(base_url)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] > 0:
+        return
+    del _OLLAMA_CLIENTS[base_url]
+    client = entry[0]
+    if hasattr(client, "_client") and hasattr(client._client, "aclose"):
+        await client._client.aclose()
+
 
 class OllamaEmbedder(Embedder):
-    def __init__(self, base_url: str, model: str) -> None:
+    def __init__(
+        self, base_url: str, model: str, batch_size: int = 64, dim: int | None = None
+    ) -> None:
+        self._base_url = base_url
         self._model = model
-        self._client = OllamaAsyncClient(host=base_url)
+        self._batch_size = max(1, batch_size)
+        # embedders for the same Ollama share one client and connection pool
+        self._client = _acquire_ollama_client(base_url)
+        self._closed = False
+        self._dim = dim
+
+    @property
+    def dim(self) -> int | None:
+        return self._dim
+
+    async def warmup(self) -> None:
+        # loads the model in Ollama and opens the HTTP connection up front
+        vec = await self.embed("warmup")
+        self._dim = len(vec)
+        await asyncio.to_thread(_save_dim, self._model, self._dim)
 
-    async def embed(self, text: str) -> list[float]:
-        resp = await self._client.embeddings(model=self._model, prompt=text)
-        vec = resp.embedding
-        return [float(x) for x in vec]
+    async def embed(self, text: str) -> Vector:
+        # same /api/embed endpoint as embed_batch: the two share cache entries,
+        # so they must return the same (normalized) vectors
+        resp = await self._client.embed(model=self._model, input=[text])
+        return np.asarray(resp.embeddings[0], dtype=np.float32)
+
+    async def embed_batch(self, texts: list[str]) -> list[Vector]:
+        # /api/embed takes a list of inputs: one request per batch_size texts
+        out: list[Vector] = []
+        for i in range(0, len(texts), self._batch_size):
+            resp = await self._client.embed(
+                model=self._model, input=texts[i : i + self._batch_size]
+            )
+            out.extend(np.asarray(resp.embeddings, dtype=np.float32))
+        return out
 
     async def aclose(self) -> None:
-        if hasattr(self._client, "client") and hasattr(self._client.client, "aclose"):
-            await self._client.client.aclose()
+        if not self._closed:
+            self._closed = True
+            await _release_ollama_client(self._base_url)
+
+
+class CachedEmbedder(Embedder):
+    """LRU cache in front of another embedder.
+
+    Queries are keyed by (namespace, whitespace-normalized text), so repeated
+    questions skip the embedding round trip. Entries older than `ttl` seconds
+    are re-embedded; ttl <= 0 keeps them until evicted.
+    """
+
+    def __init__(
+        self, inner: Embedder, namespace: str, maxsize: int = 512, ttl: float = 0.0
+    ) -> None:
+        self._inner = inner
+        self._namespace = namespace
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Vector]] = OrderedDict()
+
+    def _key(self, text: str) -> tuple[str, str]:
+        return (self._namespace, " ".join(text.split()))
+
+    def _get(self, key: tuple[str, str], now: float) -> Vector | None:
+        hit = self._entries.get(key)
+        if hit is None or (self._ttl > 0 and now - hit[0] >= self._ttl):
+            return None
+        self._entries.move_to_end(key)
+        return hit[1]
+
+    def _put(self, key: tuple[str, str], now: float, vec: Vector) -> None:
+        # cached vectors are handed to every caller, so keep them read-only
+        vec.flags.writeable = False
+        self._entries[key] = (now, vec)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    async def embed(self, text: str) -> Vector:
+        key = self._key(text)
+        now = time.monotonic()
+        vec = self._get(key, now)
+        if vec is None:
+            vec = await self._inner.embed(text)
+            self._put(key, now, vec)
+        return vec
+
+    async def embed_batch(self, texts: list[str]) -> list[Vector]:
+        now = time.monotonic()
+        keys = [self._key(t) for t in texts]
+        found = {key: vec for key in keys if (vec := self._get(key, now)) is not None}
+        # embed each distinct miss once, in a single inner batch
+        misses: dict[tuple[str, str], str] = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                misses.setdefault(key, text)
+        if misses:
+            vecs = await self._inner.embed_batch(list(misses.values()))
+            for key, vec in zip(misses, vecs, strict=True):
+                self._put(key, now, vec)
+                found[key] = vec
+        return [found[key] for key in keys]
+
+    @property
+    def dim(self) -> int | None:
+        return self._inner.dim
+
+    async def warmup(self) -> None:
+        await self._inner.warmup()
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class _TTLCache(Generic[K, V]):
+    """LRU mapping bounded in count and age.
+
+    Least recently read entries are dropped once more than `maxsize` are
+    held; entries older than `ttl` seconds read as missing (ttl <= 0 keeps
+    them until evicted).
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float) -> None:
+        self._name = name
+        self._maxsize = max(1, maxsize)
+        self._ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self._ttl > 0 and now - stored_at >= self._ttl
+
+    def get(self, key: K) -> V | None:
+        hit = self._entries.get(key)
+        if hit is None or self._expired(hit[0], time.monotonic()):
+            if hit is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return hit[1]
+
+    def __setitem__(self, key: K, value: V) -> None:
+        now = time.monotonic()
+        self._entries[key] = (now, value)
+        self._entries.move_to_end(key)
+        # expired entries sit at the old end unless they were read recently
+        while self._entries:
+            oldest, (stored_at, _) = next(iter(self._entries.items()))
+            if len(self._entries) <= self._maxsize and not self._expired(stored_at, now):
+                break
+            del self._entries[oldest]
+            self.evictions += 1
+            logging.debug(
+                "Evicted %s %s (size=%d hits=%d misses=%d evictions=%d)",
+                self._name, oldest, len(self._entries), self.hits, self.misses, self.evictions,
+            )
+
+    def pop(self, key: K) -> V | None:
+        hit = self._entries.pop(key, None)
+        return hit[1] if hit is not None else None
+
+    def items(self) -> list[tuple[K, V]]:
+        return [(key, value) for key, (_, value) in self._entries.items()]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 @dataclass
 class AppCtx:
     sd: Any
-    embedder: Optional[Embedder]
-    rag_store: dict[str, dict[str, Any]]
+    embedder: Embedder | None
+    # subgraph key -> serialized payload
+    rag_store: _TTLCache[str, str]
+    # (tag, rounded query hash, k) -> KNN (ids, scores)
+    knn_cache: _TTLCache[tuple[str, bytes, int], tuple[NDArray[np.uint64], NDArray[np.float32]]]
+    # edge id -> edge fetched by id
+    edge_cache: _TTLCache[int, EdgeRow]
+    # node id -> node as last read, for nodes reached again within the ttl
+    node_cache: _TTLCache[int, NodeOut]
+    # (node id, direction, limit) -> list_adjacency rows
+    adj_cache: _TTLCache[tuple[int, str, int], list[AdjRow]]
 
 
 def build_server() -> FastMCP:
@@ -73,16 +528,74 @@ def build_server() -> FastMCP:
     # default tag is read at tool invocation to support runtime overrides
     ollama_url = os.environ.get("OLLAMA_URL", "http://localhost:11434")
     ollama_model = os.environ.get("OLLAMA_MODEL", "nomic-embed-text:v1.5")
-
-    from contextlib import asynccontextmanager
-    from collections.abc import AsyncIterator
+    embed_cache_size = int(os.environ.get("STARDUST_EMBED_CACHE_SIZE", "512"))
+    embed_cache_ttl = float(os.environ.get("STARDUST_EMBED_CACHE_TTL", "0"))
+    embed_batch_size = int(os.environ.get("STARDUST_EMBED_BATCH", "64"))
+    embed_warmup = os.environ.get("STARDUST_EMBED_WARMUP", "1") != "0"
+    embed_warmup_timeout = float(os.environ.get("STARDUST_EMBED_WARMUP_TIMEOUT", "30"))
+    rag_store_size = int(os.environ.get("STARDUST_RAG_STORE_SIZE", "1024"))
+    rag_store_ttl = float(os.environ.get("STARDUST_RAG_STORE_TTL", "3600"))
+    knn_cache_size = int(os.environ.get("STARDUST_KNN_CACHE_SIZE", "256"))
+    knn_cache_ttl = float(os.environ.get("STARDUST_KNN_CACHE_TTL", "300"))
+    edge_cache_size = int(os.environ.get("STARDUST_EDGE_CACHE_SIZE", "4096"))
+    edge_cache_ttl = float(os.environ.get("STARDUST_EDGE_CACHE_TTL", "300"))
+    node_cache_size = int(os.environ.get("STARDUST_NODE_CACHE_SIZE", "8192"))
+    node_cache_ttl = float(os.environ.get("STARDUST_NODE_CACHE_TTL", "300"))
+    adj_cache_size = int(os.environ.get("STARDUST_ADJ_CACHE_SIZE", "16384"))
+    adj_ttl = float(os.environ.get("STARDUST_ADJ_TTL", "60"))
+    default_max_nodes = int(os.environ.get("STARDUST_MAX_NODES", "2000"))
+    default_max_edges = int(os.environ.get("STARDUST_MAX_EDGES", "20000"))
 
     @asynccontextmanager
     async def lifespan(_: FastMCP) -> AsyncIterator[AppCtx]:
         logging.info("Connecting to Stardust at %s", stardust_url)
-        sd = await sd_connect(stardust_url)
-        embedder: Optional[Embedder] = OllamaEmbedder(ollama_url, ollama_model)
-        ctx = AppCtx(sd=sd, embedder=embedder, rag_store={})
+        dims = await asyncio.to_thread(_load_dims_cache)
+        embedder: Embedder | None = CachedEmbedder(
+            OllamaEmbedder(
+                ollama_url,
+                ollama_model,
+                batch_size=embed_batch_size,
+                dim=dims.get(ollama_model),
+            ),
+            namespace=ollama_model,
+            maxsize=embed_cache_size,
+            ttl=embed_cache_ttl,
+        )
+        # warm Ollama while connecting, so the first query doesn't pay for it;
+        # a model whose dimension an earlier run recorded is not warmed again
+        warm = (
+            asyncio.create_task(embedder.warmup())
+            if embedder is not None and embed_warmup and embedder.dim is None
+            else None
+        )
+        if embedder is not None and embedder.dim is not None:
+            logging.info("Embedder dim=%s known from %s", embedder.dim, _DIMS_CACHE_PATH)
+        try:
+            sd = await sd_connect(stardust_url, lazy_reads=True)
+        except BaseException:
+            if warm is not None:
+                warm.cancel()
+            if embedder is not None:
+                await embedder.aclose()
+            raise
+        if warm is not None:
+            try:
+                # a stalled Ollama must not hold up startup; queries embed lazily
+                await asyncio.wait_for(warm, embed_warmup_timeout)
+                logging.info("Embedder ready (dim=%s)", embedder.dim if embedder else None)
+            except TimeoutError:
+                logging.warning("Embedder warmup timed out after %ss", embed_warmup_timeout)
+            except Exception as e:
+                logging.warning("Embedder warmup failed: %s", e)
+        ctx = AppCtx(
+            sd=sd,
+            embedder=embedder,
+            rag_store=_TTLCache("subgraph", rag_store_size, rag_store_ttl),
+            knn_cache=_TTLCache("knn", knn_cache_size, knn_cache_ttl),
+            edge_cache=_TTLCache("edge", edge_cache_size, edge_cache_ttl),
+            node_cache=_TTLCache("node", node_cache_size, node_cache_ttl),
+            adj_cache=_TTLCache("adjacency", adj_cache_size, adj_ttl),
+        )
         try:
             yield ctx
         finally:
@@ -90,7 +603,7 @@ def build_server() -> FastMCP:
                 await sd.aclose()
             except Exception:
                 pass
-            if isinstance(embedder, OllamaEmbedder):
+            if embedder is not None:
                 try:
                     await embedder.aclose()
                 except Exception:
@@ -98,39 +611,69 @@ def build_server() -> FastMCP:
 
     mcp = FastMCP("stardust", lifespan=lifespan)
 
-    def _props_list_to_dict(props_result: dict[str, Any]) -> dict[str, Any]:
-        items = props_result.get("props", [])
-        out: dict[str, Any] = {}
-        for p in items:
-            key = p.get("key")
-            val = p.get("val")
-            if key is not None:
-                out[str(key)] = val
-        return out
-
-    async def fetch_node(sd: Any, node_id: int) -> NodeOut:
-        n = await sd.get_node(node_id)
-        props_res = await sd.get_node_props(node_id)
-        labels = n.get("header", {}).get("labels", {}).get("names", []) or n.get(
-            "node", {}
-        ).get("labels", {}).get("names", [])
-        node_id_out = (
-            n.get("header", {}).get("id") or n.get("node", {}).get("id") or node_id
+    async def fetch_node(
+        sd: Any, node_id: int, node_cache: _TTLCache[int, NodeOut] | None = None
+    ) -> NodeOut:
+        if node_cache is not None and node_cache_size > 0:
+            cached = node_cache.get(node_id)
+            if cached is not None:
+                return cached
+        # independent reads: both requests go out before either reply is awaited
+        n, props_res = await asyncio.gather(
+            sd.get_node(node_id), sd.get_node_props(node_id)
         )
-        return {
-            "id": int(node_id_out),
-            "labels": list(labels),
-            "props": _props_list_to_dict(props_res),
+        # read through the mapping: works on both plain dicts and lazy views
+        header = n["header"]
+        labels = header.get("labels", {}).get("names", [])
+        node: NodeOut = {
+            "id": int(header["id"]),
+            "labels": [sys.intern(str(name)) for name in labels],
+            "props": _props_dict(props_res.get("props")),
         }
+        if node_cache is not None and node_cache_size > 0:
+            node_cache[node_id] = node
+        return node
 
     async def fetch_neighbors(
         sd: Any,
         node_id: int,
         limit: int,
         direction: Literal["in", "out", "both"] = "both",
-    ) -> dict[str, Any]:
+        adj_cache: _TTLCache[tuple[int, str, int], list[AdjRow]] | None = None,
+    ) -> list[AdjRow]:
+        key = (node_id, direction, limit)
+        if adj_cache is not None and adj_cache_size > 0:
+            cached = adj_cache.get(key)
+            if cached is not None:
+                return cached
         res = await sd.list_adjacency(node=node_id, direction=direction, limit=limit)
-        return cast(dict[str, Any], res)
+        # plain tuples: a cached reply view would keep its whole RPC message alive
+        rows = [adj_row(row) for row in res.get("items") or res.get("adjacent") or []]
+        if adj_cache is not None and adj_cache_size > 0:
+            adj_cache[key] = rows
+        return rows
+
+    def edge_row(e: Any, meta: Any) -> EdgeRow:
+        # types repeat across a subgraph: keep one copy of each
+        return (
+            int(e.get("id")),
+            int(e.get("src")),
+            int(e.get("dst")),
+            sys.intern(str(meta.get("type", ""))),
+            _props_dict(meta.get("props")),
+        )
+
+    def adj_row(row: Any) -> AdjRow:
+        # support either RPC schema (items) or HTTP shape (adjacent)
+        if "edge" in row:
+            e = row.get("edge", {})
+            other = row.get("otherNode")
+            return (
+                int(other) if other is not None else None,
+                int(e.get("id")),
+                edge_row(e, row.get("meta", {})),
+            )
+        return int(row.get("neighbor")), int(row.get("edgeId")), None
 
     async def expand_subgraph(
         sd: Any,
@@ -138,111 +681,204 @@ def build_server() -> FastMCP:
         hops: int,
         per_node_limit: int,
         direction: Literal["in", "out", "both"],
+        edge_cache: _TTLCache[int, EdgeRow] | None = None,
+        node_cache: _TTLCache[int, NodeOut] | None = None,
+        adj_cache: _TTLCache[tuple[int, str, int], list[AdjRow]] | None = None,
+        max_nodes: int = 2000,
+        max_edges: int = 20000,
     ) -> tuple[list[NodeOut], list[EdgeOut]]:
         seen_nodes: set[int] = set(seeds)
-        edges: dict[int, EdgeOut] = {}
-        frontier = list(seeds)
-
-        for _ in range(max(0, hops)):
-            next_frontier: list[int] = []
-            tasks = [
-                fetch_neighbors(sd, nid, per_node_limit, direction) for nid in frontier
-            ]
-            results: list[dict[str, Any] | Exception] = await asyncio.gather(
-                *tasks, return_exceptions=True
-            )  # type: ignore[assignment]
-            to_fetch_eids: list[int] = []
-            for res in results:
-                if isinstance(res, Exception):
-                    continue
-                for row in res.get("items") or res.get("adjacent") or []:
-                    # support either RPC schema (items) or HTTP shape (adjacent)
-                    if "edge" in row:
-                        e = row.get("edge", {})
-                        meta = row.get("meta", {})
-                        eid = int(e.get("id"))
-                        if eid not in edges:
-                            props = (
-                                {
-                                    p.get("key"): p.get("val")
-                                    for p in meta.get("props", [])
-                                }
-                                if meta.get("props")
-                                else {}
-                            )
-                            edges[eid] = {
-                                "id": eid,
-                                "src": int(e.get("src")),
-                                "dst": int(e.get("dst")),
-                                "type": meta.get("type", ""),
-                                "props": props,
-                            }
-                        other = (
-                            int(row.get("otherNode", 0))
-                            if row.get("otherNode") is not None
-                            else None
+        edges = _EdgeTable()
+        # every edge taken into the subgraph, whether already added or in flight
+        requested_eids: set[int] = set()
+        # shallowest hop each node was reached at; a node is expanded from there
+        depth_of: dict[int, int] = {s: 0 for s in seeds}
+        sem = asyncio.Semaphore(_RPC_CONCURRENCY)
+
+        def fetched(row: EdgeRow) -> None:
+            edges.add(*row)
+            if edge_cache is not None and edge_cache_size > 0:
+                edge_cache[row[0]] = row
+
+        # Pipelined BFS: each adjacency reply immediately schedules its new
+        # neighbours' adjacency calls and a batched fetch of its missing
+        # edges, instead of waiting for the whole hop to finish.
+        async with asyncio.TaskGroup() as tg:
+
+            async def fetch_edge(eid: int) -> None:
+                try:
+                    async with sem:
+                        er = await sd.get_edge(eid)
+                except _RPC_ERRORS:
+                    return
+                fetched(edge_row(er.get("edge", {}), er.get("meta", {})))
+
+            async def fetch_edges(eids: list[int]) -> None:
+                try:
+                    async with sem:
+                        ers = await sd.get_edges(eids)
+                except _RPC_ERRORS as e:
+                    # no batch RPC on this server (or the batch failed): one by one
+                    logging.warning(
+                        "get_edges failed, fetching %d edges one by one: %s",
+                        len(eids),
+                        e,
+                    )
+                    for eid in eids:
+                        tg.create_task(fetch_edge(eid))
+                    return
+                for er in ers:
+                    fetched(edge_row(er.get("edge", {}), er.get("meta", {})))
+
+            async def visit(nid: int, depth: int) -> None:
+                try:
+                    async with sem:
+                        rows = await fetch_neighbors(
+                            sd, nid, per_node_limit, direction, adj_cache
                         )
-                    else:
-                        eid = int(row.get("edgeId"))
-                        if eid not in edges:
-                            to_fetch_eids.append(eid)
-                        other = int(row.get("neighbor"))
-
-                    if other is not None and other not in seen_nodes:
-                        seen_nodes.add(other)
-                        next_frontier.append(other)
-            # fetch missing edge details concurrently
-            if to_fetch_eids:
-                edge_results: list[dict[str, Any] | Exception] = await asyncio.gather(
-                    *[sd.get_edge(eid) for eid in to_fetch_eids], return_exceptions=True
-                )
-                for er in edge_results:
-                    if isinstance(er, Exception):
+                except _RPC_ERRORS:
+                    return
+                if depth_of[nid] < depth:
+                    return  # reached by a shorter path meanwhile; that visit wins
+                child = depth + 1
+                missing: list[int] = []
+                for other, eid, inline in rows:
+                    # each row adds at most one node and one edge, so checking
+                    # here keeps the subgraph within both caps; hub nodes
+                    # otherwise balloon the payload
+                    if len(seen_nodes) >= max_nodes or len(requested_eids) >= max_edges:
+                        break
+                    if eid not in requested_eids:
+                        requested_eids.add(eid)
+                        if inline is not None:
+                            edges.add(*inline)
+                        elif edge_cache is not None and (cached := edge_cache.get(eid)):
+                            edges.add(*cached)
+                        else:
+                            missing.append(eid)
+
+                    if other is None:
                         continue
-                    e = er.get("edge", {})
-                    meta = er.get("meta", {})
-                    eid = int(e.get("id"))
-                    props = (
-                        {p.get("key"): p.get("val") for p in meta.get("props", [])}
-                        if meta.get("props")
-                        else {}
-                    )
-                    edges[eid] = {
-                        "id": eid,
-                        "src": int(e.get("src")),
-                        "dst": int(e.get("dst")),
-                        "type": meta.get("type", ""),
-                        "props": props,
-                    }
-            frontier = next_frontier
-
-        node_list = list(seen_nodes)
-        chunks = [node_list[i : i + 64] for i in range(0, len(node_list), 64)]
-        nodes: list[NodeOut] = []
-        for c in chunks:
-            nodes.extend(
-                await asyncio.gather(
-                    *[fetch_node(sd, nid) for nid in c], return_exceptions=False
-                )
+                    seen_nodes.add(other)
+                    if child < depth_of.get(other, hops + 1):
+                        depth_of[other] = child
+                        if child < hops:
+                            tg.create_task(visit(other, child))
+
+                for i in range(0, len(missing), _EDGE_BATCH):
+                    tg.create_task(fetch_edges(missing[i : i + _EDGE_BATCH]))
+
+            if hops > 0:
+                for nid in depth_of:
+                    tg.create_task(visit(nid, 0))
+
+        # keep up to _NODE_FETCH_CONCURRENCY node reads in flight throughout,
+        # rather than fixed chunks that each wait for their slowest member
+        node_sem = asyncio.Semaphore(_NODE_FETCH_CONCURRENCY)
+
+        async def fetch_one(nid: int) -> NodeOut:
+            async with node_sem:
+                return await fetch_node(sd, nid, node_cache)
+
+        nodes: list[NodeOut] = await asyncio.gather(*[fetch_one(nid) for nid in seen_nodes])
+        return nodes, edges.to_list()
+
+    def subgraph_caps(max_nodes: int | None, max_edges: int | None) -> tuple[int, int]:
+        # only None falls back to the defaults: 0 is a valid cap (seeds only / no edges)
+        nodes = default_max_nodes if max_nodes is None else max_nodes
+        edges = default_max_edges if max_edges is None else max_edges
+        if nodes < 0 or edges < 0:
+            raise ValueError("max_nodes and max_edges must be >= 0")
+        return nodes, edges
+
+    async def cached_knn(
+        ctx: Context, qvec: Vector, *, tag: str, k: int
+    ) -> tuple[list[int], list[float]]:
+        # hits as parallel id/score columns: no per-hit objects on either side
+        app = ctx.request_context.lifespan_context
+        cache = app.knn_cache
+        key = _knn_key(tag, qvec, k)
+        hit = cache.get(key) if knn_cache_size > 0 else None
+        if hit is None:
+            hit = await app.sd.knn_arrays(tag=tag, query=qvec, k=k)
+            if knn_cache_size > 0:
+                cache[key] = hit
+        ids, scores = hit
+        return ids.tolist(), scores.tolist()
+
+    async def rag_search(
+        ctx: Context,
+        qvec: Vector,
+        *,
+        tag: str,
+        k: int,
+        hops: int,
+        per_node_limit: int,
+        direction: Literal["in", "out", "both"],
+        max_nodes: int,
+        max_edges: int,
+        report: bool = False,
+    ) -> RAGResult:
+        # KNN on an embedded query, expand the hits, store the subgraph payload
+        sd = ctx.request_context.lifespan_context.sd
+        if report:
+            await ctx.report_progress(0.25, 1.0, "Running KNN")
+        seed_ids, scores = await cached_knn(ctx, qvec, tag=tag, k=k)
+
+        if report:
+            await ctx.report_progress(
+                0.55, 1.0, f"Expanding {len(seed_ids)} seeds, {hops} hops"
             )
-        return nodes, list(edges.values())
+        nodes, edges = await expand_subgraph(
+            sd,
+            seed_ids,
+            hops=hops,
+            per_node_limit=per_node_limit,
+            direction=direction,
+            edge_cache=ctx.request_context.lifespan_context.edge_cache,
+            node_cache=ctx.request_context.lifespan_context.node_cache,
+            adj_cache=ctx.request_context.lifespan_context.adj_cache,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+        )
+
+        key, payload = await asyncio.to_thread(
+            _build_payload,
+            seed_ids,
+            hops,
+            nodes,
+            edges,
+            [{"id": i, "score": sc} for i, sc in zip(seed_ids, scores, strict=True)],
+            vector_tag=tag,
+            scores=dict(zip(seed_ids, scores, strict=True)),
+        )
+        ctx.request_context.lifespan_context.rag_store[key] = payload
 
-    @mcp.resource("stardust://node/{node_id}")
+        return {
+            "resource_uri": f"stardust://subgraph/{key}",
+            "seed_ids": seed_ids,
+            "k": k,
+            "hops": hops,
+            "total_nodes": len(nodes),
+            "total_edges": len(edges),
+        }
+
+    @mcp.resource("stardust://node/{node_id}", mime_type="application/json")
     async def read_node(
         node_id: int, ctx: Context
-    ) -> dict[str, Any]:
-        sd = ctx.request_context.lifespan_context.sd
-        node = await fetch_node(sd, node_id)
-        return {"id": node["id"], "labels": node["labels"], "props": node["props"]}
+    ) -> str:
+        app = ctx.request_context.lifespan_context
+        node = await fetch_node(app.sd, node_id, app.node_cache)
+        return _dumps({"id": node["id"], "labels": node["labels"], "props": node["props"]})
 
-    @mcp.resource("stardust://subgraph/{key}")
+    @mcp.resource("stardust://subgraph/{key}", mime_type="application/json")
     async def read_subgraph(
         key: str, ctx: Context
-    ) -> dict[str, Any]:
-        store = ctx.request_context.lifespan_context.rag_store
-        if key not in store:
-            return {"error": "not found"}
-        return cast(dict[str, Any], store[key])
+    ) -> str:
+        payload = ctx.request_context.lifespan_context.rag_store.get(key)
+        if payload is None:
+            return _dumps({"error": "not found"})
+        return cast(str, payload)
 
     @mcp.tool()
     async def expand_from_seeds(
@@ -251,35 +887,38 @@ def build_server() -> FastMCP:
         hops: int = 1,
         per_node_limit: int = 32,
         direction: Literal["in", "out", "both"] = "both",
+        max_nodes: int | None = None,
+        max_edges: int | None = None,
     ) -> RAGResult:
         sd = ctx.request_context.lifespan_context.sd
+        max_nodes, max_edges = subgraph_caps(max_nodes, max_edges)
 
         await ctx.report_progress(
             0.25, 1.0, f"Expanding {len(seeds)} seeds, {hops} hops"
         )
 
         nodes, edges = await expand_subgraph(
-            sd, seeds, hops=hops, per_node_limit=per_node_limit, direction=direction
+            sd,
+            seeds,
+            hops=hops,
+            per_node_limit=per_node_limit,
+            direction=direction,
+            edge_cache=ctx.request_context.lifespan_context.edge_cache,
+            node_cache=ctx.request_context.lifespan_context.node_cache,
+            adj_cache=ctx.request_context.lifespan_context.adj_cache,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
         )
 
-        preview_lines: list[str] = []
-        for n in nodes[:20]:
-            label = f" ({', '.join(n['labels'])})" if n["labels"] else ""
-            preview_lines.append(
-                f"- Node {n['id']}{label}: {str(n['props'])[:300]}"
-            )
-
-        payload = {
-            "type": "stardust-subgraph",
-            "seeds": [int(s) for s in seeds],
-            "hops": hops,
-            "nodes": nodes,
-            "edges": edges,
+        key, payload = await asyncio.to_thread(
+            _build_payload,
+            [int(s) for s in seeds],
+            hops,
+            nodes,
+            edges,
             # include topk for UI parity, set uniform score for provided seeds
-            "topk": [{"id": int(s), "score": 1.0} for s in seeds],
-            "preview_markdown": "# Subgraph Preview\n" + "\n".join(preview_lines),
-        }
-        key = str(uuid.uuid4())
+            [{"id": int(s), "score": 1.0} for s in seeds],
+        )
         ctx.request_context.lifespan_context.rag_store[key] = payload
 
         return {
@@ -295,64 +934,95 @@ def build_server() -> FastMCP:
     async def graph_rag_search(
         query_text: str,
         ctx: Context,
-        tag: Optional[str] = None,
+        tag: str | None = None,
         k: int = 8,
         hops: int = 1,
         per_node_limit: int = 32,
         direction: Literal["in", "out", "both"] = "both",
+        max_nodes: int | None = None,
+        max_edges: int | None = None,
     ) -> RAGResult:
-        sd = ctx.request_context.lifespan_context.sd
         embedder = ctx.request_context.lifespan_context.embedder
         default_tag = os.environ.get("STARDUST_VECTOR_TAG", "text")
         use_tag = tag or default_tag
+        max_nodes, max_edges = subgraph_caps(max_nodes, max_edges)
 
         await ctx.info("Embedding query…")
         if embedder is None:
             raise RuntimeError("No embedder configured")
 
         qvec = await embedder.embed(query_text)
-        await ctx.report_progress(0.25, 1.0, "Running KNN")
-        hits = await sd.knn(tag=use_tag, query=qvec, k=k)
-        seed_ids = [int(h.id) for h in hits]
-
-        await ctx.report_progress(
-            0.55, 1.0, f"Expanding {len(seed_ids)} seeds, {hops} hops"
-        )
-        nodes, edges = await expand_subgraph(
-            sd, seed_ids, hops=hops, per_node_limit=per_node_limit, direction=direction
+        return await rag_search(
+            ctx,
+            qvec,
+            tag=use_tag,
+            k=k,
+            hops=hops,
+            per_node_limit=per_node_limit,
+            direction=direction,
+            max_nodes=max_nodes,
+            max_edges=max_edges,
+            report=True,
         )
 
-        id2score = {int(h.id): float(h.score) for h in hits}
-        preview_lines: list[str] = []
-        for n in nodes[:20]:
-            s = id2score.get(int(n["id"]))
-            label = f" ({', '.join(n['labels'])})" if n["labels"] else ""
-            score_txt = f" [score={s:.3f}]" if s is not None else ""
-            preview_lines.append(
-                f"- Node {n['id']}{label}{score_txt}: {str(n['props'])[:300]}"
-            )
+    @mcp.tool()
+    async def batch_graph_rag_search(
+        queries: list[str],
+        ctx: Context,
+        tag: str | None = None,
+        k: int = 8,
+        hops: int = 1,
+        per_node_limit: int = 32,
+        direction: Literal["in", "out", "both"] = "both",
+        max_nodes: int | None = None,
+        max_edges: int | None = None,
+    ) -> list[RAGResult]:
+        embedder = ctx.request_context.lifespan_context.embedder
+        use_tag = tag or os.environ.get("STARDUST_VECTOR_TAG", "text")
+        max_nodes, max_edges = subgraph_caps(max_nodes, max_edges)
 
-        payload = {
-            "type": "stardust-subgraph",
-            "seeds": seed_ids,
-            "vector_tag": use_tag,
-            "hops": hops,
-            "nodes": nodes,
-            "edges": edges,
-            "topk": [{"id": int(h.id), "score": float(h.score)} for h in hits],
-            "preview_markdown": "# Subgraph Preview\n" + "\n".join(preview_lines),
-        }
-        key = str(uuid.uuid4())
-        ctx.request_context.lifespan_context.rag_store[key] = payload
+        if embedder is None:
+            raise RuntimeError("No embedder configured")
 
-        return {
-            "resource_uri": f"stardust://subgraph/{key}",
-            "seed_ids": seed_ids,
-            "k": k,
-            "hops": hops,
-            "total_nodes": len(nodes),
-            "total_edges": len(edges),
-        }
+        await ctx.info(f"Embedding {len(queries)} queries…")
+        qvecs = await embedder.embed_batch(queries)
+        await ctx.report_progress(0.25, 1.0, f"Searching {len(qvecs)} queries")
+        return list(
+            await asyncio.gather(
+                *(
+                    rag_search(
+                        ctx,
+                        qvec,
+                        tag=use_tag,
+                        k=k,
+                        hops=hops,
+                        per_node_limit=per_node_limit,
+                        direction=direction,
+                        max_nodes=max_nodes,
+                        max_edges=max_edges,
+                    )
+                    for qvec in qvecs
+                )
+            )
+        )
+
+    @mcp.tool()
+    async def invalidate_node(node_id: int, ctx: Context) -> bool:
+        # call after writing a node elsewhere so searches don't serve stale reads
+        app = ctx.request_context.lifespan_context
+        cached = app.node_cache.pop(node_id) is not None
+        for eid in [eid for eid, row in app.edge_cache.items() if node_id in (row[1], row[2])]:
+            app.edge_cache.pop(eid)
+        # its own neighbour lists, and each neighbour's list that leads back to it
+        for key, rows in app.adj_cache.items():
+            if key[0] == node_id or any(
+                other == node_id or (inline is not None and node_id in inline[1:3])
+                for other, _, inline in rows
+            ):
+                app.adj_cache.pop(key)
+        # its vector may have changed too
+        app.knn_cache.clear()
+        return cached
 
     @mcp.prompt()
     def answer_with_stardust(question: str, subgraph_uri: str) -> str:
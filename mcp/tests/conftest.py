@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, ClassVar
+
+import pytest
+from fastmcp import Client
+
+from stardust_mcp import server
+
+# the in-memory Stardust server lives with the client's tests
+sys.path.insert(
+    0, str(Path(__file__).resolve().parents[2] / "clients" / "python" / "tests")
+)
+
+from mock_stardust import MockStardust, run, serve
+
+Body = Callable[[Client[Any]], Awaitable[Any]]
+
+
+class FakeOllama:
+    """Stands in for ollama.AsyncClient: each text embeds to `vectors[text]`."""
+
+    vectors: ClassVar[dict[str, list[float]]] = {}
+    calls: ClassVar[list[list[str]]] = []
+
+    def __init__(self, host: str | None = None) -> None:
+        self.host = host
+
+    async def embed(self, model: str, input: list[str]) -> Any:
+        FakeOllama.calls.append(list(input))
+        return SimpleNamespace(
+            embeddings=[self.vectors.get(t, [1.0, 0.0]) for t in input]
+        )
+
+
+@pytest.fixture
+def db() -> MockStardust:
+    return MockStardust()
+
+
+@pytest.fixture
+def ollama(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> type[FakeOllama]:
+    monkeypatch.setattr(server, "OllamaAsyncClient", FakeOllama)
+    monkeypatch.setattr(server, "_DIMS_CACHE_PATH", tmp_path / "ollama-dims.json")
+    monkeypatch.setattr(FakeOllama, "vectors", {})
+    monkeypatch.setattr(FakeOllama, "calls", [])
+    return FakeOllama
+
+
+@pytest.fixture
+def with_mcp(
+    db: MockStardust, ollama: type[FakeOllama], monkeypatch: pytest.MonkeyPatch
+) -> Callable[..., Any]:
+    """Run `body(client)` against an MCP server backed by `db`; returns its result.
+
+    Keyword arguments set the server's environment, e.g. STARDUST_ADJ_TTL=0.
+    """
+
+    def go(body: Body, **env: Any) -> Any:
+        monkeypatch.setenv("STARDUST_EMBED_WARMUP", "0")
+        for name, value in env.items():
+            monkeypatch.setenv(name, str(value))
+
+        async def main() -> Any:
+            async with serve(db) as url:
+                monkeypatch.setenv("STARDUST_URL", url)
+                async with Client(server.build_server()) as client:
+                    return await body(client)
+
+        return run(main())
+
+    return go
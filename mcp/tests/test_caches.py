@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from stardust_mcp import server
+from stardust_mcp.server import CachedEmbedder, Embedder, Vector, _TTLCache
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> Clock:
+    c = Clock()
+    monkeypatch.setattr(server.time, "monotonic", c)
+    return c
+
+
+def test_ttl_cache_evicts_least_recently_read() -> None:
+    cache: _TTLCache[str, int] = _TTLCache("t", maxsize=2, ttl=0)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache["c"] = 3
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+
+
+def test_ttl_cache_expires_entries(clock: Clock) -> None:
+    cache: _TTLCache[str, int] = _TTLCache("t", maxsize=10, ttl=5)
+    cache["a"] = 1
+    clock.now += 4
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    clock.now += 1
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_ttl_cache_drops_expired_entries_on_write(clock: Clock) -> None:
+    cache: _TTLCache[str, int] = _TTLCache("t", maxsize=10, ttl=5)
+    cache["a"] = 1
+    cache["b"] = 2
+    clock.now += 5
+    cache["c"] = 3
+    assert list(cache) == ["c"]
+
+
+def test_ttl_cache_without_ttl_keeps_entries(clock: Clock) -> None:
+    cache: _TTLCache[str, int] = _TTLCache("t", maxsize=10, ttl=0)
+    cache["a"] = 1
+    clock.now += 10**6
+    assert cache.get("a") == 1
+
+
+def test_ttl_cache_pop_items_clear() -> None:
+    cache: _TTLCache[int, str] = _TTLCache("t", maxsize=0, ttl=0)
+    cache[1] = "x"
+    assert len(cache) == 1  # maxsize is at least 1
+    cache[2] = "y"
+    assert cache.items() == [(2, "y")]
+    assert cache.pop(2) == "y" and cache.pop(2) is None
+    cache[3] = "z"
+    cache.clear()
+    assert len(cache) == 0
+
+
+class CountingEmbedder(Embedder):
+    def __init__(self) -> None:
+        self.seen: list[str] = []
+
+    async def embed(self, text: str) -> Vector:
+        self.seen.append(text)
+        return np.array([len(text)], dtype=np.float32)
+
+
+def test_cached_embedder_shares_entries_between_embed_and_batch(clock: Clock) -> None:
+    inner = CountingEmbedder()
+    cached = CachedEmbedder(inner, namespace="m", maxsize=8, ttl=60)
+
+    async def main() -> None:
+        a = await cached.embed("hello  world")
+        assert not a.flags.writeable
+        vecs = await cached.embed_batch(["hello world", "x", "x"])
+        assert [v.tolist() for v in vecs] == [[12.0], [1.0], [1.0]]
+        assert vecs[0] is a
+        clock.now += 60
+        await cached.embed("x")
+
+    asyncio.run(main())
+    # whitespace-normalized hit, one embed per distinct miss, then a ttl expiry
+    assert inner.seen == ["hello  world", "x", "x"]
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+from conftest import FakeOllama
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from mock_stardust import MockStardust
+
+
+async def call(client: Client[Any], tool: str, **args: Any) -> Any:
+    return (await client.call_tool(tool, args)).structured_content
+
+
+async def read(client: Client[Any], uri: str) -> Any:
+    (content,) = await client.read_resource(uri)
+    return json.loads(content.text)  # type: ignore[union-attr]
+
+
+def _star(db: MockStardust, leaves: int) -> int:
+    """A hub node with `leaves` outgoing edges."""
+    hub = db.add_node(["Hub"], {"name": {"text": "hub"}})
+    for i in range(leaves):
+        db.add_edge(hub, db.add_node(["Leaf"], {"i": {"i64": i}}), "HAS")
+    return hub
+
+
+def test_expand_from_seeds_stores_the_subgraph(db: MockStardust, with_mcp: Any) -> None:
+    a = db.add_node(["Person"], {"name": {"text": "Ada"}})
+    b = db.add_node(["Person"], {"name": {"text": "Bob"}})
+    c = db.add_node(["Person"], {"name": {"text": "Cy"}})
+    ab = db.add_edge(a, b, "KNOWS", {"since": {"i64": 2020}})
+    db.add_edge(b, c, "KNOWS")
+
+    async def body(client: Client[Any]) -> None:
+        res = await call(client, "expand_from_seeds", seeds=[a], hops=1)
+        assert res["seed_ids"] == [a]
+        assert (res["total_nodes"], res["total_edges"]) == (2, 1)
+        payload = await read(client, res["resource_uri"])
+        assert payload["type"] == "stardust-subgraph" and payload["seeds"] == [a]
+        assert sorted(n["id"] for n in payload["nodes"]) == [a, b]
+        assert payload["edges"] == [
+            {
+                "id": ab,
+                "src": a,
+                "dst": b,
+                "type": "KNOWS",
+                "props": {"since": {"i64": 2020}},
+            }
+        ]
+        assert "Ada" in payload["preview_markdown"]
+
+        two = await call(client, "expand_from_seeds", seeds=[a], hops=2)
+        assert (two["total_nodes"], two["total_edges"]) == (3, 2)
+        missing = await read(client, "stardust://subgraph/nope")
+        assert missing == {"error": "not found"}
+
+    with_mcp(body)
+
+
+def test_read_node_resource(db: MockStardust, with_mcp: Any) -> None:
+    nid = db.add_node(["Person"], {"name": {"text": "Ada"}, "age": {"i64": 36}})
+
+    async def body(client: Client[Any]) -> Any:
+        return await read(client, f"stardust://node/{nid}")
+
+    # prop values keep their Value union form
+    assert with_mcp(body) == {
+        "id": nid,
+        "labels": ["Person"],
+        "props": {"name": {"text": "Ada"}, "age": {"i64": 36}},
+    }
+
+
+def test_expansion_caps(db: MockStardust, with_mcp: Any) -> None:
+    hub = _star(db, 10)
+
+    async def body(client: Client[Any]) -> None:
+        seeds_only = await call(client, "expand_from_seeds", seeds=[hub], max_nodes=0)
+        assert (seeds_only["total_nodes"], seeds_only["total_edges"]) == (1, 0)
+        few_nodes = await call(client, "expand_from_seeds", seeds=[hub], max_nodes=4)
+        assert few_nodes["total_nodes"] == 4
+        few_edges = await call(client, "expand_from_seeds", seeds=[hub], max_edges=3)
+        assert few_edges["total_edges"] == 3
+        with pytest.raises(ToolError):
+            await call(client, "expand_from_seeds", seeds=[hub], max_nodes=-1)
+
+    with_mcp(body)
+
+
+def test_default_caps_come_from_the_environment(
+    db: MockStardust, with_mcp: Any
+) -> None:
+    hub = _star(db, 10)
+
+    async def body(client: Client[Any]) -> Any:
+        return await call(client, "expand_from_seeds", seeds=[hub])
+
+    res = with_mcp(body, STARDUST_MAX_NODES=5, STARDUST_MAX_EDGES=2)
+    assert (res["total_nodes"], res["total_edges"]) == (3, 2)
+
+
+def test_missing_edges_are_fetched_in_one_batch(
+    db: MockStardust, with_mcp: Any
+) -> None:
+    hub = _star(db, 20)
+
+    async def body(client: Client[Any]) -> Any:
+        return await call(client, "expand_from_seeds", seeds=[hub])
+
+    assert with_mcp(body)["total_edges"] == 20
+    assert db.calls["getEdgesBatch"] == 1 and db.calls["getEdge"] == 0
+
+
+def test_repeat_expansion_is_served_from_the_caches(
+    db: MockStardust, with_mcp: Any
+) -> None:
+    hub = _star(db, 5)
+
+    async def body(client: Client[Any]) -> None:
+        first = await call(client, "expand_from_seeds", seeds=[hub])
+        before = db.calls.copy()
+        again = await call(client, "expand_from_seeds", seeds=[hub])
+        assert again["total_edges"] == first["total_edges"] == 5
+        assert db.calls == before
+
+    with_mcp(body)
+
+
+def test_caches_can_be_disabled(db: MockStardust, with_mcp: Any) -> None:
+    hub = _star(db, 5)
+
+    async def body(client: Client[Any]) -> None:
+        for _ in range(2):
+            await call(client, "expand_from_seeds", seeds=[hub])
+
+    with_mcp(
+        body,
+        STARDUST_ADJ_CACHE_SIZE=0,
+        STARDUST_NODE_CACHE_SIZE=0,
+        STARDUST_EDGE_CACHE_SIZE=0,
+    )
+    assert db.calls["listAdjacency"] == 2
+    assert db.calls["getNode"] == 12 and db.calls["getEdgesBatch"] == 2
+
+
+def test_graph_rag_search_seeds_from_knn(
+    db: MockStardust, with_mcp: Any, ollama: type[FakeOllama]
+) -> None:
+    near = db.add_node(["Doc"], vectors={"text": [0.0, 1.0]})
+    far = db.add_node(["Doc"], vectors={"text": [1.0, 0.0]})
+    ollama.vectors["what is near"] = [0.0, 1.0]
+
+    async def body(client: Client[Any]) -> None:
+        res = await call(
+            client, "graph_rag_search", query_text="what is near", k=2, hops=0
+        )
+        assert res["seed_ids"] == [near, far]
+        payload = await read(client, res["resource_uri"])
+        assert payload["vector_tag"] == "text"
+        assert payload["topk"] == [
+            {"id": near, "score": 1.0},
+            {"id": far, "score": 0.0},
+        ]
+        # the same question again: embedding and KNN both come from cache
+        await call(client, "graph_rag_search", query_text="what  is near", k=2, hops=0)
+
+    with_mcp(body)
+    assert db.calls["knn"] == 1
+    assert ollama.calls == [["what is near"]]
+
+
+def test_batch_graph_rag_search_keeps_query_order(
+    db: MockStardust, with_mcp: Any, ollama: type[FakeOllama]
+) -> None:
+    x = db.add_node(vectors={"text": [1.0, 0.0]})
+    y = db.add_node(vectors={"text": [0.0, 1.0]})
+    ollama.vectors.update({"y?": [0.0, 1.0], "x?": [1.0, 0.0]})
+
+    async def body(client: Client[Any]) -> Any:
+        res = await call(
+            client, "batch_graph_rag_search", queries=["y?", "x?", "y?"], k=1
+        )
+        return [r["seed_ids"] for r in res["result"]]
+
+    assert with_mcp(body) == [[y], [x], [y]]
+    # one embed request for the distinct queries
+    assert ollama.calls == [["y?", "x?"]]
+
+
+def test_invalidate_node_drops_stale_reads(db: MockStardust, with_mcp: Any) -> None:
+    a = db.add_node(["N"], {"name": {"text": "a"}}, vectors={"text": [1.0, 0.0]})
+    b = db.add_node(["N"], {"name": {"text": "b"}}, vectors={"text": [0.0, 1.0]})
+    ab = db.add_edge(a, b, "REL")
+
+    async def body(client: Client[Any]) -> None:
+        await call(client, "expand_from_seeds", seeds=[a])
+        await call(client, "graph_rag_search", query_text="q", k=1, hops=0)
+
+        # written elsewhere: b renamed and the edge removed
+        db.nodes[b].hot = [("name", {"text": "b2"})]
+        del db.edges[ab]
+        stale = await call(client, "expand_from_seeds", seeds=[a])
+        assert stale["total_edges"] == 1
+
+        assert await call(client, "invalidate_node", node_id=b) == {"result": True}
+        # a's neighbour list led back to b, so it was dropped as well
+        fresh = await call(client, "expand_from_seeds", seeds=[a])
+        assert (fresh["total_nodes"], fresh["total_edges"]) == (1, 0)
+        node = await read(client, f"stardust://node/{b}")
+        assert node["props"] == {"name": {"text": "b2"}}
+        assert await call(client, "invalidate_node", node_id=12345) == {"result": False}
+
+        await call(client, "graph_rag_search", query_text="q", k=1, hops=0)
+
+    with_mcp(body)
+    assert db.calls["knn"] == 2
+
+
+def test_bytes_props_are_readable(db: MockStardust, with_mcp: Any) -> None:
+    # non-scalar props are stored as the bytes of their repr
+    nid = db.add_node(
+        ["Doc"],
+        {"tags": {"bytes": b"['a', 'b']"}, "raw": {"bytes": b"\xff"}},
+        vectors={"text": [1.0, 0.0]},
+    )
+
+    async def body(client: Client[Any]) -> None:
+        node = await read(client, f"stardust://node/{nid}")
+        assert node["props"] == {
+            "tags": {"bytes": "['a', 'b']"},
+            "raw": {"bytes": "�"},
+        }
+        res = await call(client, "expand_from_seeds", seeds=[nid], hops=0)
+        payload = await read(client, res["resource_uri"])
+        assert payload["nodes"][0]["props"] == node["props"]
+        res = await call(client, "graph_rag_search", query_text="q", k=1, hops=0)
+        assert res["seed_ids"] == [nid]
+
+    with_mcp(body)
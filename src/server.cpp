@@ -2,6 +2,7 @@
 #include "encode.hpp"
 #include <kj/debug.h>
 #include <kj/array.h>
+#include <cstring>
 
 namespace stardust::rpc
 {
@@ -145,6 +146,20 @@ namespace stardust::rpc
         arr.set(i, store.getLabelName(ls.labelIds[i]));
     }
 
+    // Data columns are documented as little-endian; encode byte by byte so the
+    // wire format doesn't depend on the host (compiles to a plain store on LE).
+    void putLE64(capnp::byte *p, uint64_t x)
+    {
+      for (int i = 0; i < 8; ++i)
+        p[i] = capnp::byte((x >> (i * 8)) & 0xff);
+    }
+
+    void putLE32(capnp::byte *p, uint32_t x)
+    {
+      for (int i = 0; i < 4; ++i)
+        p[i] = capnp::byte((x >> (i * 8)) & 0xff);
+    }
+
     stardust::VectorF32 fromRpcVector(VectorF32::Reader v)
     {
       stardust::VectorF32 out{};
@@ -201,6 +216,15 @@ namespace stardust::rpc
         toRpcProperty(hp[i], h.hotProps[i], store);
     }
 
+    void toRpcEdgeMeta(EdgeMeta::Builder b, const stardust::EdgeRef &edge, stardust::Store &store)
+    {
+      b.setType(store.getRelTypeName(store.getEdgeTypeId(edge)));
+      auto propsRes = store.getEdgeProps(stardust::GetEdgePropsParams{.edgeId = edge.id});
+      auto props = b.initProps(propsRes.props.size());
+      for (uint32_t i = 0; i < propsRes.props.size(); ++i)
+        toRpcProperty(props[i], propsRes.props[i], store);
+    }
+
   } // namespace
 
   StardustImpl::StardustImpl(stardust::Store &s) : store_(s) {}
@@ -292,8 +316,18 @@ namespace stardust::rpc
 
   kj::Promise<void> StardustImpl::upsertVector(UpsertVectorContext ctx)
   {
-    auto p = ctx.getParams();
-    auto params = p.getParams();
+    applyUpsertVector(ctx.getParams().getParams());
+    return kj::READY_NOW;
+  }
+
+  kj::Promise<void> StardustImpl::upsertVectorStream(UpsertVectorStreamContext ctx)
+  {
+    applyUpsertVector(ctx.getParams().getParams());
+    return kj::READY_NOW;
+  }
+
+  void StardustImpl::applyUpsertVector(UpsertVectorParams::Reader params)
+  {
     stardust::UpsertVectorParams in{};
     in.id = params.getId();
     in.vector = fromRpcVector(params.getVector());
@@ -304,7 +338,6 @@ namespace stardust::rpc
       in.tagId = store_.getOrCreateVecTagId(stardust::GetOrCreateVecTagIdParams{std::string(params.getTag().cStr()), true, dimOpt});
     }
     store_.upsertVector(in);
-    return kj::READY_NOW;
   }
 
   kj::Promise<void> StardustImpl::deleteVector(DeleteVectorContext ctx)
@@ -463,6 +496,21 @@ namespace stardust::rpc
 
     auto res = ctx.getResults();
     auto out = res.initResult();
+    if (params.getPacked())
+    {
+      const size_t n = resv.hits.size();
+      auto ids = out.initIds(n * sizeof(uint64_t));
+      auto scores = out.initScores(n * sizeof(float));
+      for (size_t i = 0; i < n; ++i)
+      {
+        uint32_t scoreBits;
+        static_assert(sizeof(scoreBits) == sizeof(resv.hits[i].score));
+        std::memcpy(&scoreBits, &resv.hits[i].score, sizeof(scoreBits));
+        putLE64(ids.begin() + i * sizeof(uint64_t), resv.hits[i].id);
+        putLE32(scores.begin() + i * sizeof(float), scoreBits);
+      }
+      return kj::READY_NOW;
+    }
     auto hits = out.initHits(resv.hits.size());
     for (uint32_t i = 0; i < resv.hits.size(); ++i)
     {
@@ -646,16 +694,38 @@ namespace stardust::rpc
     outEdge.setSrc(edge.src);
     outEdge.setDst(edge.dst);
     // Populate meta: type + props
-    auto outMeta = res.initMeta();
+    toRpcEdgeMeta(res.initMeta(), edge, store_);
+    return kj::READY_NOW;
+  }
+
+  kj::Promise<void> StardustImpl::getNodesBatch(GetNodesBatchContext ctx)
+  {
+    auto p = ctx.getParams();
+    auto ids = p.getParams().getIds();
+    auto res = ctx.getResults();
+    auto headers = res.initResult().initHeaders(ids.size());
+    for (uint32_t i = 0; i < ids.size(); ++i)
     {
-      uint32_t typeId = store_.getEdgeTypeId(edge);
-      outMeta.setType(store_.getRelTypeName(typeId));
+      auto resv = store_.getNode(stardust::GetNodeParams{.id = ids[i]});
+      toRpcNodeHeader(headers[i], resv.header, store_);
     }
-    {
-      auto propsRes = store_.getEdgeProps(stardust::GetEdgePropsParams{.edgeId = edge.id});
-      auto props = outMeta.initProps(propsRes.props.size());
-      for (uint32_t i = 0; i < propsRes.props.size(); ++i)
-        toRpcProperty(props[i], propsRes.props[i], store_);
+    return kj::READY_NOW;
+  }
+
+  kj::Promise<void> StardustImpl::getEdgesBatch(GetEdgesBatchContext ctx)
+  {
+    auto p = ctx.getParams();
+    auto ids = p.getParams().getEdgeIds();
+    auto res = ctx.getResults();
+    auto out = res.initResult().initEdges(ids.size());
+    for (uint32_t i = 0; i < ids.size(); ++i)
+    {
+      auto edge = store_.getEdge(stardust::GetEdgeParams{.edgeId = ids[i]});
+      auto outEdge = out[i].initEdge();
+      outEdge.setId(edge.id);
+      outEdge.setSrc(edge.src);
+      outEdge.setDst(edge.dst);
+      toRpcEdgeMeta(out[i].initMeta(), edge, store_);
     }
     return kj::READY_NOW;
   }
@@ -16,6 +16,7 @@ namespace stardust::rpc
     kj::Promise<void> upsertNodeProps(UpsertNodePropsContext ctx) override;
     kj::Promise<void> setNodeLabels(SetNodeLabelsContext ctx) override;
     kj::Promise<void> upsertVector(UpsertVectorContext ctx) override;
+    kj::Promise<void> upsertVectorStream(UpsertVectorStreamContext ctx) override;
     kj::Promise<void> deleteVector(DeleteVectorContext ctx) override;
     kj::Promise<void> addEdge(AddEdgeContext ctx) override;
     kj::Promise<void> updateEdgeProps(UpdateEdgePropsContext ctx) override;
@@ -30,11 +31,15 @@ namespace stardust::rpc
     kj::Promise<void> getNodeProps(GetNodePropsContext ctx) override;
     kj::Promise<void> getVectors(GetVectorsContext ctx) override;
     kj::Promise<void> getEdge(GetEdgeContext ctx) override;
+    kj::Promise<void> getNodesBatch(GetNodesBatchContext ctx) override;
+    kj::Promise<void> getEdgesBatch(GetEdgesBatchContext ctx) override;
 
     kj::Promise<void> deleteNode(DeleteNodeContext ctx) override;
     kj::Promise<void> deleteEdge(DeleteEdgeContext ctx) override;
 
   private:
+    void applyUpsertVector(UpsertVectorParams::Reader params);
+
     stardust::Store &store_;
   };
 
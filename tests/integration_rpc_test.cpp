@@ -1112,4 +1112,157 @@ TEST_F(IntegrationRpc, Step19_KnnQueries)
 
     EXPECT_EQ(hits.size(), 0u);
   }
+
+  // test 6: packed results carry the same hits as ids/scores columns
+  {
+    std::vector<float> q = {1.0f, 0.0f, 0.0f, 0.0f};
+    auto build = [&](bool packed)
+    {
+      auto knn = cap.knnRequest();
+      auto kp = knn.initParams();
+      kp.setTag("knn-test");
+      auto vec = kp.initQuery();
+      vec.setDim(4);
+      capnp::Data::Builder data = vec.initData(q.size() * 4);
+      std::memcpy(data.begin(), q.data(), q.size() * 4);
+      kp.setK(3);
+      kp.setPacked(packed);
+      return knn;
+    };
+
+    auto plain = build(false).send().wait(ws);
+    auto packed = build(true).send().wait(ws);
+    auto hits = plain.getResult().getHits();
+    auto ids = packed.getResult().getIds();
+    auto scores = packed.getResult().getScores();
+
+    ASSERT_EQ(hits.size(), 3u);
+    EXPECT_EQ(packed.getResult().getHits().size(), 0u);
+    ASSERT_EQ(ids.size(), 3u * sizeof(uint64_t));
+    ASSERT_EQ(scores.size(), 3u * sizeof(float));
+    for (size_t i = 0; i < hits.size(); ++i)
+    {
+      uint64_t id = 0;
+      float score = 0.0f;
+      std::memcpy(&id, ids.begin() + i * sizeof(id), sizeof(id));
+      std::memcpy(&score, scores.begin() + i * sizeof(score), sizeof(score));
+      EXPECT_EQ(id, hits[i].getId());
+      EXPECT_FLOAT_EQ(score, hits[i].getScore());
+    }
+  }
+}
+
+TEST_F(IntegrationRpc, Step20_BatchGetNodesAndEdges)
+{
+  auto &ws = client->getWaitScope();
+  auto cap = client->getMain<stardust::rpc::Stardust>();
+
+  uint64_t n1 = 0, n2 = 0, e = 0;
+  {
+    auto req = cap.createNodeRequest();
+    auto lnames = req.initParams().initLabels().initNames(1);
+    lnames.set(0, "batch-a");
+    n1 = req.send().wait(ws).getResult().getNode().getId();
+  }
+  {
+    auto req = cap.createNodeRequest();
+    auto lnames = req.initParams().initLabels().initNames(1);
+    lnames.set(0, "batch-b");
+    n2 = req.send().wait(ws).getResult().getNode().getId();
+  }
+  {
+    auto add = cap.addEdgeRequest();
+    auto ap = add.initParams();
+    ap.setSrc(n1);
+    ap.setDst(n2);
+    auto meta = ap.initMeta();
+    meta.setType("batch-edge");
+    auto props = meta.initProps(1);
+    props[0].setKey("weight");
+    props[0].initVal().setI64(7);
+    e = add.send().wait(ws).getEdge().getId();
+  }
+
+  // nodes come back in request order
+  {
+    auto req = cap.getNodesBatchRequest();
+    auto ids = req.initParams().initIds(2);
+    ids.set(0, n2);
+    ids.set(1, n1);
+
+    auto resp = req.send().wait(ws);
+    auto headers = resp.getResult().getHeaders();
+
+    ASSERT_EQ(headers.size(), 2u);
+    EXPECT_EQ(headers[0].getId(), n2);
+    EXPECT_EQ(headers[1].getId(), n1);
+    ASSERT_EQ(headers[0].getLabels().getNames().size(), 1u);
+    EXPECT_STREQ(headers[0].getLabels().getNames()[0].cStr(), "batch-b");
+  }
+
+  {
+    auto req = cap.getEdgesBatchRequest();
+    auto ids = req.initParams().initEdgeIds(1);
+    ids.set(0, e);
+
+    auto resp = req.send().wait(ws);
+    auto edges = resp.getResult().getEdges();
+
+    ASSERT_EQ(edges.size(), 1u);
+    EXPECT_EQ(edges[0].getEdge().getId(), e);
+    EXPECT_EQ(edges[0].getEdge().getSrc(), n1);
+    EXPECT_EQ(edges[0].getEdge().getDst(), n2);
+    EXPECT_STREQ(edges[0].getMeta().getType().cStr(), "batch-edge");
+    ASSERT_EQ(edges[0].getMeta().getProps().size(), 1u);
+    EXPECT_EQ(edges[0].getMeta().getProps()[0].getVal().getI64(), 7);
+  }
+}
+
+TEST_F(IntegrationRpc, Step21_StreamUpsertVectors)
+{
+  auto &ws = client->getWaitScope();
+  auto cap = client->getMain<stardust::rpc::Stardust>();
+
+  uint64_t n = 0;
+  {
+    auto req = cap.createNodeRequest();
+    auto lnames = req.initParams().initLabels().initNames(1);
+    lnames.set(0, "stream-node");
+    n = req.send().wait(ws).getResult().getNode().getId();
+  }
+
+  // fire all stream calls before waiting on any of them
+  const char *tags[] = {"stream-a", "stream-b", "stream-c"};
+  auto v = makeDemoVec(4);
+  std::vector<kj::Promise<void>> sent;
+  for (auto tag : tags)
+  {
+    auto req = cap.upsertVectorStreamRequest();
+    auto p = req.initParams();
+    p.setId(n);
+    p.setTag(tag);
+    auto vec = p.initVector();
+    vec.setDim(4);
+    capnp::Data::Builder data = vec.initData(v.size() * 4);
+    std::memcpy(data.begin(), v.data(), v.size() * 4);
+    sent.push_back(req.send());
+  }
+  for (auto &promise : sent)
+    promise.wait(ws);
+
+  {
+    auto gv = cap.getVectorsRequest();
+    gv.initParams().setId(n);
+
+    auto resp = gv.send().wait(ws);
+    auto res = resp.getResult().getVectors();
+
+    ASSERT_EQ(res.size(), 3u);
+    for (auto tv : res)
+    {
+      auto data = tv.getVector().getData();
+      ASSERT_EQ(data.size(), v.size() * 4);
+      EXPECT_EQ(std::memcmp(data.begin(), v.data(), v.size() * 4), 0);
+    }
+  }
 }